@@ -5,6 +5,9 @@ Central configuration file for SalesShortcut application.
 Provides port configurations and default parameters for all agents and services.
 """
 
+import os
+from functools import lru_cache
+
 # --- Agent Port Configurations ---
 DEFAULT_LEAD_FINDER_PORT: int = 8081
 DEFAULT_LEAD_MANAGER_PORT: int = 8082
@@ -37,3 +40,25 @@ DEFAULT_LEAD_MANAGER_ARTIFACT_NAME: str = "lead_management_decision"
 # SDR
 DEFAULT_SDR_ARTIFACT_NAME: str = "sdr_decision"
 
+
+# --- Resolved Service URLs ---
+# Environment overrides (e.g. Cloud Run service URLs) win over the local
+# defaults above. Each URL is resolved once per process, without a trailing slash.
+@lru_cache(maxsize=1)
+def lead_finder_url() -> str:
+    return os.environ.get("LEAD_FINDER_SERVICE_URL", DEFAULT_LEAD_FINDER_URL).rstrip("/")
+
+
+@lru_cache(maxsize=1)
+def lead_manager_url() -> str:
+    return os.environ.get("LEAD_MANAGER_SERVICE_URL", DEFAULT_LEAD_MANAGER_URL).rstrip("/")
+
+
+@lru_cache(maxsize=1)
+def sdr_url() -> str:
+    return os.environ.get("SDR_SERVICE_URL", DEFAULT_SDR_URL).rstrip("/")
+
+
+@lru_cache(maxsize=1)
+def ui_client_url() -> str:
+    return os.environ.get("UI_CLIENT_SERVICE_URL", DEFAULT_UI_CLIENT_URL).rstrip("/")
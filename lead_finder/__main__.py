@@ -5,12 +5,16 @@ import common.config as defaults
 # Attempt to import A2A/ADK dependencies
 try:
     import uvicorn
+    from starlette.routing import Route
     from a2a.server.apps import A2AStarletteApplication
     from a2a.server.request_handlers import DefaultRequestHandler
     from a2a.server.tasks import InMemoryTaskStore
     from a2a.types import AgentCapabilities, AgentCard, AgentSkill
     from .lead_finder.agent import lead_finder_agent
+    from .lead_finder.callbacks import flush_ui_updates
     from .agent_executor import LeadFinderAgentExecutor
+    from .middleware import StreamingAwareGZipMiddleware
+    from .routes import find_leads, health_check
     ADK_AVAILABLE = True
 except ImportError as e:
     ADK_AVAILABLE = False
@@ -93,12 +97,30 @@ def main(host: str, port: int):
             http_handler=request_handler
         )
         
+        app = app_builder.build()
+        # Insert the health check FIRST so it is matched before the A2A routes
+        app.routes.insert(0, Route(path='/health', methods=['GET'], endpoint=health_check))
+        # Plain HTTP search used by the UI client when A2A is unavailable
+        app.routes.insert(1, Route(path='/find_leads', methods=['POST'], endpoint=find_leads))
+        # Business lists in lead results compress well; small responses are left alone.
+        # The NDJSON stream skips gzip so each lead is flushed to the client as it is found.
+        app.add_middleware(StreamingAwareGZipMiddleware, minimum_size=1024, exclude_paths=("/find_leads",))
+        # Send any queued UI updates before the server exits
+        app.add_event_handler("shutdown", flush_ui_updates)
+
         logger.info(f"Starting LEAD FINDER A2A server on {host}:{port}")
         # Start the Server
         import uvicorn
     
         logger.info(f"Starting RiskGuard A2A server on http://{host}:{port}/")
-        uvicorn.run(app_builder.build(), host=host, port=port)
+        uvicorn.run(
+            app,
+            host=host,
+            port=port,
+            loop="uvloop",
+            http="httptools",
+            access_log=False,
+        )
             
     except Exception as e:
         logger.error(f"Failed to start LEAD FINDER A2A server: {e}")
@@ -1,5 +1,5 @@
-import json
 import logging
+from functools import lru_cache
 from typing import Any
 from datetime import datetime
 from pathlib import Path
@@ -14,9 +14,11 @@ from common.config import DEFAULT_LEAD_FINDER_ARTIFACT_NAME, DEFAULT_UI_CLIENT_U
 from google.adk import Runner
 from google.adk.sessions import InMemorySessionService, Session
 from google.adk.artifacts import InMemoryArtifactService
+from google.adk.events import Event, EventActions
 from google.genai import types as genai_types
 
 from .lead_finder.agent import lead_finder_agent
+from .lead_finder.tools.maps_search import MAPS_RESULTS_STATE_KEY
 
 logger = logging.getLogger(__name__)
 
@@ -35,17 +37,22 @@ def log_to_file(message: str):
 with open(log_file, 'w', encoding='utf-8') as f:
     f.write(f"=== LEAD FINDER AGENT's LOG - {datetime.now().isoformat()} ===\n\n")
 
+@lru_cache(maxsize=1)
+def _get_runner() -> Runner:
+    """Build the ADK Runner once so all executors share its session store."""
+    return Runner(
+        app_name="lead_finder_adk_runner",
+        agent=lead_finder_agent,
+        artifact_service=InMemoryArtifactService(),
+        session_service=InMemorySessionService(),
+    )
+
 class LeadFinderAgentExecutor(AgentExecutor):
     """Executes the Lead Finder ADK agent logic in response to A2A requests."""
 
     def __init__(self):
         self._adk_agent = lead_finder_agent
-        self._adk_runner = Runner(
-            app_name="lead_finder_adk_runner",
-            agent=self._adk_agent,
-            artifact_service=InMemoryArtifactService(),
-            session_service=InMemorySessionService(),
-        )
+        self._adk_runner = _get_runner()
         logger.info("LeadFinderAgentExecutor initialized with ADK Runner.")
 
     async def execute(self, context: RequestContext, event_queue: EventQueue):
@@ -98,22 +105,11 @@ class LeadFinderAgentExecutor(AgentExecutor):
             )
             return
 
-        # Prepare input for ADK Agent with clear structure
-        agent_input_dict = {
-            "city": city_name,
-            "ui_client_url": ui_client_url,
-            "operation": "find_leads"
-        }
-        
-        # Create a clear user message for the agent
+        # Create a clear user message for the agent. The city itself reaches the
+        # sub-agent prompts through session state, so no JSON copy is sent.
         user_message = f"Find potential business leads in {city_name}"
-        
-        # Create both text and structured data
         adk_content = genai_types.Content(
-            parts=[
-                genai_types.Part(text=user_message),
-                genai_types.Part(text=json.dumps(agent_input_dict))
-            ]
+            parts=[genai_types.Part(text=user_message)]
         )
 
         # [Rest of the session handling code remains the same...]
@@ -132,6 +128,21 @@ class LeadFinderAgentExecutor(AgentExecutor):
                 logger.exception(f"Task {context.task_id}: Exception during get_session: {e}")
                 session = None
 
+            if session:
+                # A reused session keeps state from earlier searches; start this run
+                # with the new city and no raw results so nothing is merged twice
+                try:
+                    await self._adk_runner.session_service.append_event(
+                        session,
+                        Event(
+                            author="user",
+                            actions=EventActions(state_delta={"city": city_name, MAPS_RESULTS_STATE_KEY: []}),
+                        ),
+                    )
+                except Exception as e:
+                    logger.exception(f"Task {context.task_id}: Exception while resetting session state: {e}")
+                    session = None
+
             if not session:
                 logger.info(f"Task {context.task_id}: Creating new ADK session for city: {city_name}")
                 try:
@@ -139,7 +150,7 @@ class LeadFinderAgentExecutor(AgentExecutor):
                         app_name=self._adk_runner.app_name,
                         user_id="a2a_user",
                         session_id=session_id_for_adk,
-                        state={"city": city_name},  # Store city in session state
+                        state={"city": city_name, "ui_client_url": ui_client_url},  # Store city in session state
                     )
                     if session:
                         logger.info(f"Task {context.task_id}: Successfully created ADK session with city: {city_name}")
@@ -168,29 +179,41 @@ class LeadFinderAgentExecutor(AgentExecutor):
             logger.info(f"Task {context.task_id}: Calling ADK run_async for city: {city_name}")
             final_result = {"status": "completed", "city": city_name, "businesses": []}
             
-            async for event in self._adk_runner.run_async(
+            events = self._adk_runner.run_async(
                 user_id="a2a_user",
                 session_id=session_id_for_adk,
                 new_message=adk_content,
-            ):
-                log_entry = f" ** - - - - - ** \n [Event] Author: {event.author}, \n Type: {type(event).__name__}, \n Final: {event.is_final_response()}, \n Content: {event.content}"
-                log_to_file(log_entry)
-                
-                if event.is_final_response():
-                    if event.content and event.content.parts:
-                        # Look for function calls with business data
-                        for part in event.content.parts:
-                            if hasattr(part, 'function_call') and part.function_call:
-                                if part.function_call.name == "final_lead_results":
-                                    businesses = part.function_call.args.get("businesses", [])
-                                    final_result["businesses"] = businesses
-                                    final_result["count"] = len(businesses)
-                                    logger.info(f"Task {context.task_id}: Found {len(businesses)} businesses for {city_name}")
-                            elif hasattr(part, "text") and part.text:
-                                final_result["message"] = part.text
-
+            )
+            try:
+                async for event in events:
+                    log_entry = f" ** - - - - - ** \n [Event] Author: {event.author}, \n Type: {type(event).__name__}, \n Final: {event.is_final_response()}, \n Content: {event.content}"
+                    log_to_file(log_entry)
+
+                    found_results = False
+                    if event.is_final_response():
+                        if event.content and event.content.parts:
+                            # Look for function calls with business data
+                            for part in event.content.parts:
+                                if hasattr(part, 'function_call') and part.function_call:
+                                    if part.function_call.name == "final_lead_results":
+                                        businesses = part.function_call.args.get("businesses", [])
+                                        final_result["businesses"] = businesses
+                                        final_result["count"] = len(businesses)
+                                        found_results = True
+                                        logger.info(f"Task {context.task_id}: Found {len(businesses)} businesses for {city_name}")
+                                elif hasattr(part, "text") and part.text:
+                                    final_result["message"] = part.text
+                    if found_results:
+                        # Nothing after the final results is needed
+                        break
+            finally:
+                # Close the generator right away to release the LLM stream
+                await events.aclose()
+
+            # final_result is built here from plain JSON types; model_construct
+            # skips re-validating a potentially large business list
             task_updater.add_artifact(
-                parts=[Part(root=DataPart(data=final_result))],
+                parts=[Part(root=DataPart.model_construct(data=final_result))],
                 name="lead_search_results",
             )
             task_updater.complete()
@@ -2,19 +2,22 @@
 
 import json
 import asyncio
-import os
+import gzip
 import logging
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 import re
 
 import httpx
+import orjson
 
 import common.config as config
 
 from google.adk.agents.callback_context import CallbackContext
 from google.genai import types as genai_types
 
+from .utils import make_http_client
+
 logger = logging.getLogger(__name__)
 
 # --- New helper function to extract city from address ---
@@ -31,16 +34,41 @@ def extract_city_from_address(address: Optional[str]) -> Optional[str]:
     return None
 # --- End new helper function ---
 
-def send_update_to_ui(business_data: dict):
+# Maximum number of business updates sent to the UI client in one request
+UI_BULK_CHUNK_SIZE = 500
+
+# Resolved once per process instead of on every UI update
+_CALLBACK_ENDPOINT = f"{config.ui_client_url()}/agent_callbacks_bulk"
+
+# Payload fields shared by every lead finder update
+_STATIC_UPDATE_FIELDS = {"agent_type": "lead_finder", "status": "found"}
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_GZIP_JSON_HEADERS = {**_JSON_HEADERS, "Content-Encoding": "gzip"}
+
+# Bodies larger than this are gzip-compressed before sending
+_GZIP_MIN_SIZE = 1024
+
+# Business fields the UI client reads when creating a business card
+_UI_DATA_FIELDS = ("name", "city", "phone", "email", "description")
+
+# Queued UI updates are flushed in bulk by a background task on the agent's event loop
+_UPDATE_QUEUE_MAXSIZE = 10_000
+_FLUSH_LINGER = 0.05
+_update_queue: Optional[asyncio.Queue] = None
+_flusher_task: Optional[asyncio.Task] = None
+
+# Long-lived client so UI callbacks reuse pooled keep-alive connections
+_UI_CLIENT = make_http_client(
+    httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=30.0)
+)
+
+
+def build_ui_update(business_data: dict) -> dict:
     """
-    Sends a single business update to the UI client's /agent_callback endpoint.
+    Builds the /agent_callback payload for a single business.
     This function will now ensure a 'city' field is present in the 'data' payload.
     """
-    ui_client_url = os.environ.get(
-        "UI_CLIENT_SERVICE_URL", config.DEFAULT_UI_CLIENT_URL
-    ).rstrip("/")
-    callback_endpoint = f"{ui_client_url}/agent_callback"
-
     # Create a copy of the business_data to modify it for UI client's validation
     data_for_ui = business_data.copy()
 
@@ -54,43 +82,127 @@ def send_update_to_ui(business_data: dict):
             # Optionally, you might want to return here or set a default city
             # if 'city' is strictly required for every business.
 
-    payload = {
-        "agent_type": "lead_finder",
+    return {
+        **_STATIC_UPDATE_FIELDS,
         "business_id": data_for_ui.get("id"), # Use id from the potentially modified data_for_ui
-        "status": "found",
         "message": f"Successfully discovered business: {data_for_ui.get('name')}",
-        "timestamp": datetime.now().isoformat(),
-        "data": data_for_ui # Send the modified data with the top-level 'city'
+        "timestamp": datetime.now(), # Serialized by orjson
+        # Only send what the UI needs, including the top-level 'city'
+        "data": {field: data_for_ui[field] for field in _UI_DATA_FIELDS if field in data_for_ui}
+    }
+
+
+async def _post_updates_chunk(chunk: List[Dict[str, Any]]):
+    """Posts one chunk of business updates to the UI client."""
+    payload = {
+        "agent_type": "lead_finder",
+        "updates": [build_ui_update(biz) for biz in chunk],
     }
 
-    logger.info(f"Sending POST to UI endpoint: {callback_endpoint} for business: {data_for_ui.get('name')}")
+    logger.info(f"Sending POST to UI endpoint: {_CALLBACK_ENDPOINT} with {len(chunk)} businesses")
     try:
-        with httpx.Client() as client:
-            response = client.post(callback_endpoint, json=payload, timeout=10.0)
-            response.raise_for_status()
-            logger.info(f"Successfully posted update for {data_for_ui.get('name')} to UI. Status: {response.status_code}")
+        body = orjson.dumps(payload, default=str)
+        headers = _JSON_HEADERS
+        if len(body) > _GZIP_MIN_SIZE:
+            body = gzip.compress(body, compresslevel=6)
+            headers = _GZIP_JSON_HEADERS
+        response = await _UI_CLIENT.post(_CALLBACK_ENDPOINT, content=body, headers=headers)
+        response.raise_for_status()
+        logger.info(f"Successfully posted {len(chunk)} business updates to UI. Status: {response.status_code}")
     except httpx.RequestError as e:
         logger.error(f"Error sending POST request to UI client at {e.request.url}: {e}")
     except Exception as e:
         logger.error(f"An unexpected error occurred while posting to the UI client: {e}")
 
 
+async def _flusher(queue: asyncio.Queue):
+    """
+    Background task that coalesces queued businesses into bulk UI POSTs.
+    Waits up to _FLUSH_LINGER seconds for more updates before sending a batch.
+    """
+    while True:
+        batch = [await queue.get()]
+        try:
+            while len(batch) < UI_BULK_CHUNK_SIZE:
+                batch.append(await asyncio.wait_for(queue.get(), timeout=_FLUSH_LINGER))
+        except asyncio.TimeoutError:
+            pass
+        try:
+            await _post_updates_chunk(batch)
+        finally:
+            for _ in batch:
+                queue.task_done()
+
+
+def _get_update_queue() -> asyncio.Queue:
+    """Returns the UI update queue, starting its flusher on the running loop if needed."""
+    global _update_queue, _flusher_task
+    if _update_queue is None:
+        _update_queue = asyncio.Queue(maxsize=_UPDATE_QUEUE_MAXSIZE)
+    if _flusher_task is None or _flusher_task.done():
+        # Restart a dead flusher on the same queue so updates still waiting in it are sent
+        _flusher_task = asyncio.get_running_loop().create_task(_flusher(_update_queue))
+    return _update_queue
+
+
+def send_updates_to_ui(businesses: List[Dict[str, Any]]):
+    """
+    Queues business updates for the UI client's /agent_callbacks_bulk endpoint
+    and returns immediately; a background flusher sends them in bulk.
+    Must be called from the agent's event loop.
+    """
+    queue = _get_update_queue()
+
+    for biz in businesses:
+        if queue.full():
+            # Drop the oldest update rather than blocking the agent
+            queue.get_nowait()
+            queue.task_done()
+            logger.warning("UI update queue is full, dropping the oldest update")
+        queue.put_nowait(biz)
+
+
+async def flush_ui_updates(timeout: float = 5.0):
+    """Waits until queued UI updates have been sent, e.g. on shutdown."""
+    if _update_queue is None:
+        return
+    try:
+        await asyncio.wait_for(_update_queue.join(), timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.warning(f"Timed out flushing {_update_queue.qsize()} pending UI updates")
+
+
 async def post_results_callback(callback_context: CallbackContext) -> Optional[genai_types.Content]:
+    """
+    Sends discovered businesses to the UI and saves them as the final artifact.
+    Returns None; when no businesses were found nothing is sent or saved.
+    """
     agent_name = callback_context.agent_name
     logger.info(f"[Callback] Exiting agent: {agent_name}. Processing final result.")
 
     final_businesses: List[Dict[str, Any]] = []
 
-    # Access the state directly
-    context_state = callback_context.state.to_dict()
-    print(f"[Callback] Current callback_context.state: {context_state}")
-
-    # Check if 'final_merged_leads' key exists in the state
-    if 'final_merged_leads' in context_state:
-        merged_leads_text = context_state['final_merged_leads']
-        
-        # Use regex to find the JSON block in the text
-        json_match = re.search(r"```json\s*([\s\S]*?)\s*```", merged_leads_text)
+    # Only copy the whole state when it will actually be logged
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[Callback] Current callback_context.state: %s", callback_context.state.to_dict())
+
+    # Single lookup of the merged leads instead of materializing the state dict
+    merged_leads_text = callback_context.state.get('final_merged_leads')
+    if merged_leads_text is not None:
+
+        # MergerAgent stores the merged leads as a list; older runs stored LLM text
+        json_match = None
+        if isinstance(merged_leads_text, list):
+            final_businesses = merged_leads_text
+            logger.info(f"[Callback] Successfully extracted {len(final_businesses)} businesses from callback_context.state.")
+        elif not isinstance(merged_leads_text, str):
+            logger.warning("[Callback] 'final_merged_leads' in state is neither a list nor text: %s", type(merged_leads_text).__name__)
+            return None
+        else:
+            # Use regex to find the JSON block in the text
+            json_match = re.search(r"```json\s*([\s\S]*?)\s*```", merged_leads_text)
+            if not json_match:
+                logger.warning(f"[Callback] No JSON block found in 'final_merged_leads' state data.")
         if json_match:
             try:
                 json_str = json_match.group(1)
@@ -99,20 +211,17 @@ async def post_results_callback(callback_context: CallbackContext) -> Optional[g
                     final_businesses = parsed_data
                     logger.info(f"[Callback] Successfully extracted {len(final_businesses)} businesses from callback_context.state.")
                 else:
-                    logger.warning(f"[Callback] Extracted JSON from state is not a list: {parsed_data}")
+                    logger.warning("[Callback] Extracted JSON from state is not a list: %s", type(parsed_data).__name__)
             except json.JSONDecodeError as e:
                 logger.error(f"[Callback] Failed to parse JSON from callback_context.state: {e}")
-        else:
-            logger.warning(f"[Callback] No JSON block found in 'final_merged_leads' state data.")
     else:
         logger.warning("[Callback] 'final_merged_leads' not found in callback_context.state.")
         return None
 
 
+    # Nothing to ship: skip UI updates and artifact saving entirely
     if not final_businesses:
         logger.warning("[Callback] No businesses found for UI update. Check MergerAgent's output_key and state propagation.")
-        # For deeper debugging if needed, log the full state
-        logger.warning(f"Full callback_context.state.to_dict(): {context_state}")
         return None
 
 
@@ -123,7 +232,8 @@ async def post_results_callback(callback_context: CallbackContext) -> Optional[g
             # Filter out empty strings/None values before joining for hashing
             clean_components = [c for c in biz_id_components if c and c != 'None']
             biz["id"] = "generated_" + str(hash(tuple(clean_components))) if clean_components else str(datetime.now().timestamp())
-        send_update_to_ui(biz)
+
+    send_updates_to_ui(final_businesses)
 
     try:
         # Saving artifacts
@@ -3,6 +3,8 @@ Configuration for the Lead Finder Agent.
 """
 
 import os
+from dataclasses import dataclass
+from functools import cache
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -15,17 +17,48 @@ logger = logging.getLogger(__name__)
 logger.info(f"Config loading - GOOGLE_MAPS_API_KEY from env: {bool(os.getenv('GOOGLE_MAPS_API_KEY'))}")
 logger.info(f"Config loading - GOOGLE_MAPS_API_KEY length: {len(os.getenv('GOOGLE_MAPS_API_KEY', ''))}")
 
-# Model configuration
-# Using gemini-2.0-flash for higher token limits to handle more businesses
-MODEL = os.getenv("MODEL", "gemini-2.0-flash")
-TEMPERATURE = float(os.getenv("TEMPERATURE", "0.2"))
-TOP_P = float(os.getenv("TOP_P", "0.95"))
-TOP_K = int(os.getenv("TOP_K", "40"))
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Typed, immutable Lead Finder settings read from the environment."""
+    # Model configuration
+    MODEL: str
+    TEMPERATURE: float
+    TOP_P: float
+    TOP_K: int
+    # BigQuery configuration
+    PROJECT: str
+    DATASET_ID: str
+    TABLE_ID: str
+    # Write mock BigQuery uploads to local JSON files (only used when BigQuery is unavailable)
+    DEBUG_DUMP_TO_FILE: bool
+    # Google Maps API configuration
+    GOOGLE_MAPS_API_KEY: str
 
-# BigQuery configuration
-PROJECT = os.getenv("GOOGLE_CLOUD_PROJECT", "")
-DATASET_ID = os.getenv("DATASET_ID", "lead_finder_data")
-TABLE_ID = os.getenv("TABLE_ID", "business_leads")
+@cache
+def load_config() -> Config:
+    """Read settings from the environment once; call load_config.cache_clear() to reload."""
+    return Config(
+        # Using gemini-2.0-flash for higher token limits to handle more businesses
+        MODEL=os.getenv("MODEL", "gemini-2.0-flash"),
+        TEMPERATURE=float(os.getenv("TEMPERATURE", "0.2")),
+        TOP_P=float(os.getenv("TOP_P", "0.95")),
+        TOP_K=int(os.getenv("TOP_K", "40")),
+        PROJECT=os.getenv("GOOGLE_CLOUD_PROJECT", ""),
+        DATASET_ID=os.getenv("DATASET_ID", "lead_finder_data"),
+        TABLE_ID=os.getenv("TABLE_ID", "business_leads"),
+        DEBUG_DUMP_TO_FILE=os.getenv("DEBUG_DUMP_TO_FILE", "false").lower() == "true",
+        GOOGLE_MAPS_API_KEY=os.getenv("GOOGLE_MAPS_API_KEY", ""),
+    )
 
-# Google Maps API configuration
-GOOGLE_MAPS_API_KEY = os.getenv("GOOGLE_MAPS_API_KEY", "")
+CONFIG = load_config()
+
+# Module-level aliases kept for existing imports
+MODEL = CONFIG.MODEL
+TEMPERATURE = CONFIG.TEMPERATURE
+TOP_P = CONFIG.TOP_P
+TOP_K = CONFIG.TOP_K
+PROJECT = CONFIG.PROJECT
+DATASET_ID = CONFIG.DATASET_ID
+TABLE_ID = CONFIG.TABLE_ID
+DEBUG_DUMP_TO_FILE = CONFIG.DEBUG_DUMP_TO_FILE
+GOOGLE_MAPS_API_KEY = CONFIG.GOOGLE_MAPS_API_KEY
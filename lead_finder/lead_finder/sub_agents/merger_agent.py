@@ -2,16 +2,47 @@
 MergerAgent implementation.
 """
 
-from google.adk.agents import LlmAgent 
-from ..config import MODEL
-from ..prompts import MERGER_AGENT_PROMPT
-from ..tools.bigquery_utils import bigquery_upload_tool
+import logging
+from typing import AsyncGenerator
 
-merger_agent = LlmAgent(
-    model=MODEL,
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.genai import types as genai_types
+
+from ..tools.bigquery_utils import bigquery_upload
+from ..tools.maps_search import MAPS_RESULTS_STATE_KEY
+from ..utils import merge_and_dedup
+
+logger = logging.getLogger(__name__)
+
+
+class MergerAgent(BaseAgent):
+    """Deterministically merges and deduplicates search results, then uploads them."""
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        state = ctx.session.state
+        merged = merge_and_dedup(state.get(MAPS_RESULTS_STATE_KEY, []))
+        logger.info(f"[MergerAgent] Merged {len(merged)} unique businesses")
+
+        if merged:
+            upload_result = await bigquery_upload(merged, city=state.get("city", ""), search_type="general")
+            logger.info(f"[MergerAgent] BigQuery upload status: {upload_result.get('status')}")
+
+        yield Event(
+            author=self.name,
+            invocation_id=ctx.invocation_id,
+            branch=ctx.branch,
+            content=genai_types.Content(
+                role="model",
+                parts=[genai_types.Part(text=f"Merged {len(merged)} unique businesses.")],
+            ),
+            # Clear the raw results so the next search in this session starts empty
+            actions=EventActions(state_delta={"final_merged_leads": merged, MAPS_RESULTS_STATE_KEY: []}),
+        )
+
+
+merger_agent = MergerAgent(
     name="MergerAgent",
     description="Agent for processing and merging business data",
-    instruction=MERGER_AGENT_PROMPT,
-    tools=[bigquery_upload_tool],
-    output_key="final_merged_leads", 
 )
@@ -1,17 +1,23 @@
 """
 BigQuery utility tools for lead data management.
 """
+import io
 import logging
 import asyncio
+import aiofiles
+import orjson
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from google.adk.tools import FunctionTool
 from google.cloud import bigquery
 from google.cloud.exceptions import NotFound, Conflict
-from ..config import PROJECT, DATASET_ID, TABLE_ID
+from ..config import CONFIG, PROJECT, DATASET_ID, TABLE_ID
 
 logger = logging.getLogger(__name__)
 
+# Rows per streaming insert request, per BigQuery's recommended batch size
+INSERT_CHUNK_SIZE = 500
+
 class BigQueryClient:
     """BigQuery client wrapper for lead data operations."""
     
@@ -218,10 +224,18 @@ class BigQueryClient:
             duplicate_count = len(rows_to_insert) - len(new_rows)
             
             if new_rows:
-                # Insert new rows
+                # Insert new rows in streaming batches, using place_id for best-effort dedup
                 def _insert_rows():
+                    errors = []
                     try:
-                        errors = self.client.insert_rows_json(self.table_ref, new_rows)
+                        for start in range(0, len(new_rows), INSERT_CHUNK_SIZE):
+                            chunk = new_rows[start:start + INSERT_CHUNK_SIZE]
+                            chunk_errors = self.client.insert_rows_json(
+                                self.table_ref, chunk, row_ids=[row["place_id"] for row in chunk]
+                            )
+                            for error in chunk_errors:
+                                error["index"] = error.get("index", 0) + start
+                            errors.extend(chunk_errors)
                         return errors
                     except Exception as e:
                         logger.error(f"Error in insert_rows_json: {e}")
@@ -363,49 +377,47 @@ class BigQueryClient:
         """Mock upload for when BigQuery is not available."""
         logger.info(f"Mock BigQuery upload: {len(businesses)} businesses for {city}")
         
+        stats = {
+            "total_input": len(businesses),
+            "new_inserted": len(businesses),
+            "duplicates_skipped": 0,
+            "failed": 0
+        }
+
+        # Nothing worth dumping for an empty batch
+        if not CONFIG.DEBUG_DUMP_TO_FILE or not businesses:
+            return {
+                "status": "success",
+                "message": "Mock upload complete (set DEBUG_DUMP_TO_FILE=true to write records to a file)",
+                "stats": stats
+            }
+
         # Write to JSON file as fallback
         timestamp = datetime.now().isoformat().replace(":", "-")
         filename = f"bigquery_mock_{city}_{timestamp}.json"
-        
-        # Prepare data for JSON serialization (avoid datetime objects)
-        serializable_businesses = []
-        for business in businesses:
-            # Create a copy and ensure all values are JSON serializable
-            clean_business = {}
-            for key, value in business.items():
-                if isinstance(value, datetime):
-                    clean_business[key] = value.isoformat()
-                else:
-                    clean_business[key] = value
-            serializable_businesses.append(clean_business)
-        
+
+        # orjson serializes datetime values natively
         mock_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),
             "city": city,
             "search_type": search_type,
             "record_count": len(businesses),
-            "data": serializable_businesses
+            "data": businesses
         }
-        
+
         try:
-            import json
-            from pathlib import Path
-            
-            def _write_file():
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(mock_data, f, indent=2, ensure_ascii=False, default=str)
-            
-            await asyncio.to_thread(_write_file)
-            
+            payload = orjson.dumps(
+                mock_data,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            )
+            async with aiofiles.open(filename, 'wb') as f:
+                await f.write(payload)
+
             return {
                 "status": "success",
                 "message": f"Mock upload complete - written to {filename}",
-                "stats": {
-                    "total_input": len(businesses),
-                    "new_inserted": len(businesses),
-                    "duplicates_skipped": 0,
-                    "failed": 0
-                },
+                "stats": stats,
                 "mock_file": filename
             }
             
@@ -551,8 +563,8 @@ async def bigquery_no_website_upload(data: List[Dict[str, Any]], city: str = "",
     if not filtered:
         return {"status": "success", "message": "No businesses without websites to upload", "stats": {"total": 0}}
 
-    # Use BigQuery client
-    client = BigQueryClient()
+    # Reuse the module-level BigQuery client
+    client = _bigquery_client
     if not client.client:
         # Fallback to mock upload
         return await client._mock_upload(filtered, city, search_type)
@@ -580,15 +592,20 @@ async def bigquery_no_website_upload(data: List[Dict[str, Any]], city: str = "",
             logger.warning(f"Validation error for business {i}: {e}")
     if not rows_to_insert:
         return {"status": "error", "message": "No valid businesses to upload", "validation_errors": validation_errors}
-    # Insert rows
+    # Load rows as one newline-delimited JSON job instead of per-row streaming inserts
     def _insert_rows():
         try:
-            errors = client.client.insert_rows_json(table_ref, rows_to_insert)
-            return errors
+            payload = b"\n".join(orjson.dumps(row) for row in rows_to_insert)
+            job_config = bigquery.LoadJobConfig(
+                source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+                write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+            )
+            job = client.client.load_table_from_file(io.BytesIO(payload), table_ref, job_config=job_config)
+            job.result()
+            return job.errors or []
         except Exception as e:
-            logger.error(f"Error in insert_rows_json (no website): {e}")
+            logger.error(f"Error in load_table_from_file (no website): {e}")
             raise
-    import asyncio
     errors = await asyncio.to_thread(_insert_rows)
     if errors:
         logger.error(f"BigQuery insertion errors (no website): {errors}")
@@ -618,7 +635,7 @@ async def bigquery_query_no_website_leads(
     """
     Query businesses from business_leads_no_websites table with filters.
     """
-    client = BigQueryClient()
+    client = _bigquery_client
     if not client.client:
         return {"status": "error", "message": "BigQuery client not available"}
     table_ref = ensure_no_website_table_exists(client.client, client.dataset_ref)
@@ -2,46 +2,211 @@
 Google Maps search tool implementation.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, List, Optional
-from google.adk.tools import FunctionTool
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import AsyncIterator, Dict, Any, List, Optional
+from google.adk.tools import FunctionTool, ToolContext
 import googlemaps
-from ..config import GOOGLE_MAPS_API_KEY
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from ..config import CONFIG, load_config
+from ..utils import make_http_client
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Shared pool for blocking googlemaps calls that can run side by side
+_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="gmaps")
+
+# Places Details REST endpoint, queried directly so lookups can run concurrently
+PLACE_DETAILS_URL = "https://maps.googleapis.com/maps/api/place/details/json"
+# Maximum number of Place Details requests in flight at once (API quota friendly)
+PLACE_DETAILS_CONCURRENCY = 16
+# Only the Place Details fields search_businesses reads (smaller responses, cheaper SKUs)
+PLACE_DETAILS_FIELDS = ",".join([
+    "name", "formatted_address", "formatted_phone_number", "website", "rating",
+    "user_ratings_total", "types", "price_level", "opening_hours"
+])
+# Website-only lookup (Basic SKU) used to drop places with a website before the full fetch
+PLACE_WEBSITE_FIELDS = "website"
+
+_HTTP_CLIENT = make_http_client()
+
+# Places API (New) nearby search; the field mask returns contact details inline,
+# so nearby results need no follow-up Place Details request
+PLACES_SEARCH_NEARBY_URL = "https://places.googleapis.com/v1/places:searchNearby"
+PLACES_SEARCH_NEARBY_FIELD_MASK = ",".join([
+    "places.id", "places.displayName", "places.formattedAddress", "places.nationalPhoneNumber",
+    "places.websiteUri", "places.rating", "places.userRatingCount", "places.types",
+    "places.priceLevel", "places.currentOpeningHours.openNow", "places.location"
+])
+# searchNearby returns at most 20 places per request
+PLACES_SEARCH_NEARBY_MAX_RESULTS = 20
+_PRICE_LEVELS = {
+    "PRICE_LEVEL_FREE": 0,
+    "PRICE_LEVEL_INEXPENSIVE": 1,
+    "PRICE_LEVEL_MODERATE": 2,
+    "PRICE_LEVEL_EXPENSIVE": 3,
+    "PRICE_LEVEL_VERY_EXPENSIVE": 4,
+}
+
+# How long fetched Place Details are reused (well under Google's 30 day caching limit);
+# the least recently used entries are evicted beyond PLACE_DETAILS_CACHE_MAXSIZE
+PLACE_DETAILS_CACHE_TTL = 86400
+PLACE_DETAILS_CACHE_MAXSIZE = 10_000
+
+# Process-local LRU cache of successful searches, entries expire after SEARCH_CACHE_TTL seconds.
+# Results are stored serialized so every hit gets its own copy and callers cannot alter the cache.
+SEARCH_CACHE_TTL = 600
+SEARCH_CACHE_MAXSIZE = 512
+_search_cache: "OrderedDict[tuple, tuple[float, bytes]]" = OrderedDict()
+
+# Largest number of businesses a single search returns
+MAX_SEARCH_RESULTS = 500
+
+# Session state key holding raw search results for MergerAgent
+MAPS_RESULTS_STATE_KEY = "maps_results"
+
+# Searches currently running, keyed like the search cache
+_inflight_searches: Dict[tuple, "asyncio.Future[Dict[str, Any]]"] = {}
+
+# Place types accepted by the Places Nearby "type" parameter
+_NEARBY_PLACE_TYPES = frozenset([
+    "accounting", "airport", "amusement_park", "aquarium", "art_gallery",
+    "atm", "bakery", "bank", "bar", "beauty_salon", "bicycle_store",
+    "book_store", "bowling_alley", "bus_station", "cafe", "campground",
+    "car_dealer", "car_rental", "car_repair", "car_wash", "casino",
+    "cemetery", "church", "city_hall", "clothing_store", "convenience_store",
+    "courthouse", "dentist", "department_store", "doctor", "drugstore",
+    "electrician", "electronics_store", "embassy", "fire_station", "florist",
+    "funeral_home", "furniture_store", "gas_station", "gym", "hair_care",
+    "hardware_store", "hindu_temple", "home_goods_store", "hospital", "insurance_agency",
+    "jewelry_store", "laundry", "lawyer", "library", "light_rail_station",
+    "liquor_store", "local_government_office", "locksmith", "lodging", "meal_delivery",
+    "meal_takeaway", "mosque", "movie_rental", "movie_theater", "moving_company",
+    "museum", "night_club", "painter", "park", "parking", "pet_store", "pharmacy",
+    "physiotherapist", "plumber", "police", "post_office", "primary_school",
+    "real_estate_agency", "restaurant", "roofing_contractor", "rv_park", "school",
+    "secondary_school", "shoe_store", "shopping_mall", "spa", "stadium", "storage",
+    "store", "subway_station", "supermarket", "synagogue", "taxi_stand", "tourist_attraction",
+    "train_station", "transit_station", "travel_agency", "university", "veterinary_care",
+    "zoo"
+])
+
+# Common business types searched when no specific type is provided
+_COMMON_BUSINESS_TYPES = (
+    "restaurant", "cafe", "bar", "store", "shop", "retail", "salon",
+    "bakery", "grocery", "food", "service", "repair", "contractor",
+    "doctor", "dentist", "health", "fitness", "gym", "yoga", "spa",
+    "beauty", "hair", "nail", "barber", "massage", "therapy",
+    "auto", "car", "mechanic", "dealer", "parts", "tire", "detail",
+    "real estate", "property", "apartment", "home", "house", "rental",
+    "insurance", "financial", "bank", "accounting", "tax", "legal",
+    "attorney", "lawyer", "education", "school", "tutor", "daycare",
+    "child care", "pet", "veterinary", "animal", "landscaping", "lawn",
+    "cleaning", "maid", "janitorial", "plumber", "electrician", "hvac",
+    "construction", "roofing", "painting", "flooring", "furniture",
+    "clothing", "apparel", "jewelry", "accessory", "shoe", "tailor",
+    "electronics", "computer", "phone", "repair", "photography", "art",
+    "craft", "hobby", "toy", "game", "book", "music", "instrument",
+    "church", "religious", "nonprofit", "charity", "community",
+    "event", "venue", "catering", "party", "wedding", "funeral",
+    "moving", "storage", "shipping", "delivery", "transportation"
+)
+
+# Substrings that mark a place type as business-related
+_BUSINESS_TYPE_HINTS = (
+    "restaurant", "cafe", "bar", "store", "shop", "retail",
+    "service", "business", "establishment"
+)
+
+@lru_cache(maxsize=None)
+def _is_business_type(type_: str) -> bool:
+    """Whether a place type is business-related; place types are a small fixed vocabulary."""
+    type_lc = type_.lower()
+    return any(hint in type_lc for hint in _BUSINESS_TYPE_HINTS)
+
+# Mock businesses returned when the Google Maps API is unavailable; {city} is filled per call
+_MOCK_TEMPLATE: tuple[Dict[str, Any], ...] = (
+    {
+        "place_id": "mock_{city}_1",
+        "name": "Mock Business 1 - {city}",
+        "address": "123 Main St, {city}",
+        "phone": "555-0123",
+        "website": "",  # No website
+        "rating": 4.5,
+        "total_ratings": 100,
+        "price_level": 2,
+        "is_open": True,
+        "location": {"lat": 40.7128, "lng": -74.0060}
+    },
+    {
+        "place_id": "mock_{city}_2",
+        "name": "Mock Business 2 - {city}",
+        "address": "456 Oak Ave, {city}",
+        "phone": "555-0456",
+        "website": "",  # No website
+        "rating": 4.0,
+        "total_ratings": 75,
+        "price_level": 1,
+        "is_open": True,
+        "location": {"lat": 40.7589, "lng": -73.9851}
+    },
+)
+
+# Markers of placeholder sites that should not count as a real website
+_PLACEHOLDER_WEBSITE_MARKERS = ("placeholder", "coming-soon", "under-construction")
+
+def _is_functional_website(website: str) -> bool:
+    """Whether a website looks real; checks short-circuit and the URL is lowercased once."""
+    if not website or len(website) <= 5 or "." not in website:
+        return False
+    if website.startswith("http://localhost") or website.endswith("example.com"):
+        return False
+    website_lc = website.lower()
+    return not any(marker in website_lc for marker in _PLACEHOLDER_WEBSITE_MARKERS)
+
 class GoogleMapsClient:
     """Google Maps API client wrapper for business searches."""
 
     def __init__(self):
         self.client = None
         self._api_key_checked = False
-        logger.info(f"GoogleMapsClient init - API Key from config: {bool(GOOGLE_MAPS_API_KEY)}")
-        logger.info(f"GoogleMapsClient init - API Key length: {len(GOOGLE_MAPS_API_KEY) if GOOGLE_MAPS_API_KEY else 0}")
-        try:
-            self._initialize_client()
-        except Exception as e:
-            logger.error(f"Failed to initialize in __init__: {e}")
-            self.client = None
+        self.api_key = CONFIG.GOOGLE_MAPS_API_KEY
+        # place_id -> (fetched_at, details)
+        self._details_cache: "OrderedDict[str, tuple[float, Dict[str, Any]]]" = OrderedDict()
+        logger.info(f"GoogleMapsClient init - API Key from config: {bool(self.api_key)}")
+        logger.info(f"GoogleMapsClient init - API Key length: {len(self.api_key) if self.api_key else 0}")
+        self._initialize_client()
 
     def _initialize_client(self):
         """Initialize the Google Maps client."""
-        logger.info(f"Initializing Google Maps client. API Key available: {bool(GOOGLE_MAPS_API_KEY)}, Key length: {len(GOOGLE_MAPS_API_KEY) if GOOGLE_MAPS_API_KEY else 0}")
+        logger.info(f"Initializing Google Maps client. API Key available: {bool(self.api_key)}, Key length: {len(self.api_key) if self.api_key else 0}")
         
-        if not GOOGLE_MAPS_API_KEY:
+        if not self.api_key:
             logger.warning("Google Maps API key not found. Using mock data.")
-            raise ValueError("Google Maps API key is required for Google Maps client initialization.")
+            self.client = None
+            return
 
         try:
-            self.client = googlemaps.Client(key=GOOGLE_MAPS_API_KEY)
+            # One pooled keep-alive session, sized for the concurrent search threads
+            self._session = requests.Session()
+            self._session.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=20))
+            self.client = googlemaps.Client(key=self.api_key, requests_session=self._session)
+            # City coordinates do not change - geocode each city once per process
+            self._geocode = lru_cache(maxsize=4096)(self.client.geocode)
             logger.info("Successfully initialized Google Maps client")
             # Test the client with a simple request
-            self.client.geocode("San Francisco")
+            self._geocode("San Francisco")
             logger.info("Google Maps client tested successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Google Maps client: {e}")
-            logger.error(f"API Key (first 10 chars): {GOOGLE_MAPS_API_KEY[:10] if GOOGLE_MAPS_API_KEY else 'N/A'}")
+            logger.error(f"API Key (first 10 chars): {self.api_key[:10] if self.api_key else 'N/A'}")
             self.client = None
 
     def _ensure_client(self):
@@ -49,39 +214,73 @@ class GoogleMapsClient:
         if not self.client and not self._api_key_checked:
             self._api_key_checked = True
             # Try to reinitialize in case environment wasn't ready before
-            from ..config import GOOGLE_MAPS_API_KEY as FRESH_API_KEY
-            if FRESH_API_KEY and FRESH_API_KEY != GOOGLE_MAPS_API_KEY:
+            load_config.cache_clear()
+            fresh_api_key = load_config().GOOGLE_MAPS_API_KEY
+            if fresh_api_key and fresh_api_key != self.api_key:
                 logger.info("Retrying Google Maps client initialization with fresh API key")
+                self.api_key = fresh_api_key
                 self._initialize_client()
 
-    def _get_place_details(self, place_id: str) -> Dict[str, Any]:
-        """Get detailed information for a place."""
+    async def _get_place_details(
+        self,
+        place_id: str,
+        semaphore: asyncio.Semaphore,
+        fields: str = PLACE_DETAILS_FIELDS
+    ) -> Dict[str, Any]:
+        """Get detailed information for a place, limited to the requested fields."""
         if not self.client or not place_id:
             return {}
 
+        cached = self._details_cache.get(place_id)
+        if cached is not None:
+            cached_at, cached_details = cached
+            if time.monotonic() - cached_at < PLACE_DETAILS_CACHE_TTL:
+                self._details_cache.move_to_end(place_id)
+                return cached_details
+            del self._details_cache[place_id]
+
         try:
-            result = self.client.place(place_id=place_id)
-            return result.get('result', {})
+            async with semaphore:
+                response = await _HTTP_CLIENT.get(
+                    PLACE_DETAILS_URL,
+                    params={"place_id": place_id, "fields": fields, "key": self.api_key}
+                )
+            response.raise_for_status()
+            details = response.json().get('result', {})
+            # Only full payloads are cached; a cached one also answers narrower lookups
+            if details and fields == PLACE_DETAILS_FIELDS:
+                self._details_cache[place_id] = (time.monotonic(), details)
+                self._details_cache.move_to_end(place_id)
+                if len(self._details_cache) > PLACE_DETAILS_CACHE_MAXSIZE:
+                    self._details_cache.popitem(last=False)
+            return details
         except Exception as e:
             logger.error(f"Error getting place details for {place_id}: {e}")
             return {}
 
-    def _get_primary_category(self, types: List[str]) -> str:
+    async def _get_places_details(
+        self,
+        place_ids: List[str],
+        fields: str = PLACE_DETAILS_FIELDS
+    ) -> List[Dict[str, Any]]:
+        """Get detailed information for many places concurrently."""
+        semaphore = asyncio.Semaphore(PLACE_DETAILS_CONCURRENCY)
+        return await asyncio.gather(
+            *(self._get_place_details(place_id, semaphore, fields) for place_id in place_ids)
+        )
+
+    @staticmethod
+    def _get_primary_category(types: List[str]) -> str:
         """Get the primary business category from place types."""
         if not types:
             return ""
 
         # Prioritize business-related types
-        business_types = [
-            "restaurant", "cafe", "bar", "store", "shop", "retail",
-            "service", "business", "establishment"
-        ]
-
         for type_ in types:
-            if any(bt in type_.lower() for bt in business_types):
+            if _is_business_type(type_):
                 return type_
 
-        return types[0] if types else ""
+        return types[0]
 
     def _get_open_status(self, hours: Dict[str, Any]) -> bool:
         """Get the current open status of a business."""
@@ -90,37 +289,247 @@ class GoogleMapsClient:
     def _get_mock_results(self, city: str, business_type: Optional[str] = None) -> List[Dict[str, Any]]:
         """Generate mock results for testing."""
         logger.warning(f"RETURNING MOCK DATA for {city}! Client status: {self.client}, API key checked: {self._api_key_checked}")
-        mock_businesses = [
-            {
-                "place_id": f"mock_{city.lower()}_1",
-                "name": f"Mock Business 1 - {city}",
-                "address": f"123 Main St, {city}",
-                "phone": "555-0123",
-                "website": "",  # No website
-                "rating": 4.5,
-                "total_ratings": 100,
-                "category": business_type or "General Business",
-                "price_level": 2,
-                "is_open": True,
-                "location": {"lat": 40.7128, "lng": -74.0060}
-            },
+        city_lc = city.lower()
+        category = business_type or "General Business"
+        return [
             {
-                "place_id": f"mock_{city.lower()}_2",
-                "name": f"Mock Business 2 - {city}",
-                "address": f"456 Oak Ave, {city}",
-                "phone": "555-0456",
-                "website": "",  # No website
-                "rating": 4.0,
-                "total_ratings": 75,
-                "category": business_type or "General Business",
-                "price_level": 1,
-                "is_open": True,
-                "location": {"lat": 40.7589, "lng": -73.9851}
+                **template,
+                "place_id": template["place_id"].format(city=city_lc),
+                "name": template["name"].format(city=city),
+                "address": template["address"].format(city=city),
+                "category": category,
+                "location": dict(template["location"])
             }
+            for template in _MOCK_TEMPLATE
         ]
-        return mock_businesses
 
-    def search_businesses(
+    def _search_nearby(
+        self,
+        location: Dict[str, Any],
+        radius: int,
+        place_type: Optional[str],
+        search_type: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Run a Places API (New) nearby search in a single request.
+
+        Results are converted to the legacy place shape, with their details
+        attached under "_details" so no Place Details call is needed.
+        """
+        body: Dict[str, Any] = {
+            "maxResultCount": PLACES_SEARCH_NEARBY_MAX_RESULTS,
+            "locationRestriction": {
+                "circle": {
+                    "center": {"latitude": location["lat"], "longitude": location["lng"]},
+                    "radius": min(radius, 50000)
+                }
+            }
+        }
+        if place_type:
+            body["includedTypes"] = [place_type]
+
+        try:
+            # Reuse the googlemaps client's keep-alive session
+            response = self._session.post(
+                PLACES_SEARCH_NEARBY_URL,
+                json=body,
+                headers={
+                    "X-Goog-Api-Key": self.api_key,
+                    "X-Goog-FieldMask": PLACES_SEARCH_NEARBY_FIELD_MASK
+                },
+                timeout=10
+            )
+            response.raise_for_status()
+            places = response.json().get('places', [])
+        except Exception as e:
+            logger.error(f"Error in nearby search for {search_type}: {e}")
+            return []
+
+        results = []
+        for place in places:
+            coords = place.get('location') or {}
+            geometry = {"location": {"lat": coords.get('latitude'), "lng": coords.get('longitude')}}
+            details = {
+                "name": (place.get('displayName') or {}).get('text', ''),
+                "formatted_address": place.get('formattedAddress', ''),
+                "formatted_phone_number": place.get('nationalPhoneNumber', ''),
+                "website": place.get('websiteUri', ''),
+                "rating": place.get('rating', 0),
+                "user_ratings_total": place.get('userRatingCount', 0),
+                "types": place.get('types', []),
+                "price_level": _PRICE_LEVELS.get(place.get('priceLevel'), 0),
+                "opening_hours": {"open_now": (place.get('currentOpeningHours') or {}).get('openNow', False)},
+            }
+            results.append({
+                "place_id": place.get('id', ''),
+                "name": details["name"],
+                "rating": details["rating"],
+                "geometry": geometry,
+                "_details": details
+            })
+
+        logger.info(f"Found {len(results)} results for {search_type} (nearby search)")
+        return results
+
+    async def _find_places(
+        self,
+        city: str,
+        business_type: Optional[str],
+        radius: int,
+        max_results: int
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Geocode the city and collect raw place results for each search type.
+
+        Returns None when the city cannot be geocoded.
+        """
+        # googlemaps is blocking - run its calls on the shared bounded pool
+        loop = asyncio.get_running_loop()
+
+        # First, get the city's location
+        geocode_result = await loop.run_in_executor(_POOL, self._geocode, city)
+        if not geocode_result:
+            logger.error(f"Could not find location for city: {city}")
+            return None
+
+        location = geocode_result[0]['geometry']['location']
+        logger.info(f"Found location for {city}: {location}")
+
+        all_results = []
+        processed_place_ids = set()  # To avoid duplicates
+
+        # If business_type is provided, only search for that type
+        search_types = (business_type,) if business_type else _COMMON_BUSINESS_TYPES  # Use all business types
+
+        for search_type in search_types:
+            if len(all_results) >= max_results:
+                break
+
+            # Build search query
+            if search_type:
+                query = f"{search_type} in {city}"
+            else:
+                query = f"businesses in {city}"
+
+            logger.info(f"Searching for: {query}")
+
+            # Text search and nearby search are independent - run them concurrently
+            kind_results = await asyncio.gather(*(
+                loop.run_in_executor(
+                    _POOL, self._collect_places, kind, query, location, radius, search_type, max_results
+                )
+                for kind in ("text", "nearby")
+            ))
+
+            for results in kind_results:
+                # Filter out duplicates
+                new_results = [r for r in results if r.get('place_id') not in processed_place_ids]
+
+                # Add place_ids to processed set
+                for r in new_results:
+                    processed_place_ids.add(r.get('place_id'))
+
+                all_results.extend(new_results)
+
+        logger.info(f"Total places found across all searches: {len(all_results)}")
+        return all_results
+
+    def _build_business(
+        self,
+        place_id: str,
+        place: Dict[str, Any],
+        place_details: Dict[str, Any],
+        min_rating: float,
+        exclude_websites: bool
+    ) -> Optional[Dict[str, Any]]:
+        """Shape one place into a business record, or None if it is filtered out."""
+        # Filter by rating if specified
+        rating = place_details.get('rating', place.get('rating', 0))
+        if rating < min_rating:
+            return None
+
+        # Handle website filtering if exclude_websites is True
+        website = place_details.get('website', '')
+
+        # More sophisticated website filtering:
+        # 1. If exclude_websites is False, include all businesses
+        # 2. If exclude_websites is True:
+        #    - Include businesses with no website field
+        #    - Include businesses with empty website strings
+        #    - Include businesses with potentially placeholder websites
+        if exclude_websites:
+            # Check if website exists and appears to be a real website
+            if _is_functional_website(website):
+                # This appears to be a real, functional website - skip if excluding websites
+                logger.debug("Skipping business with functional website: %s", place_details.get('name'))
+                return None
+
+        # Extract business information
+        geom_loc = (place.get('geometry') or {}).get('location') or {}
+        business = {
+            "place_id": place_id,
+            "name": place_details.get('name', place.get('name', '')),
+            "address": place_details.get('formatted_address', place.get('formatted_address', '')),
+            "phone": place_details.get('formatted_phone_number', ''),
+            "website": website,
+            "rating": rating,
+            "total_ratings": place_details.get('user_ratings_total', 0),
+            "category": self._get_primary_category(place_details.get('types', place.get('types', []))),
+            "price_level": place_details.get('price_level', 0),
+            "is_open": self._get_open_status(place_details.get('opening_hours', {})),
+            "location": {
+                "lat": geom_loc.get('lat'),
+                "lng": geom_loc.get('lng')
+            }
+        }
+
+        # Only keep businesses with valid information
+        if not (business["name"] and business["address"]):
+            return None
+        logger.debug("Added business: %s", business["name"])
+        return business
+
+    async def _find_candidates(
+        self,
+        city: str,
+        business_type: Optional[str],
+        radius: int,
+        min_rating: float,
+        max_results: int,
+        exclude_websites: bool
+    ) -> Optional[tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]], List[str]]]:
+        """
+        Find places and split them by whether their details are already known.
+
+        Returns (places, details_by_id, missing_ids), or None when the city
+        cannot be geocoded.
+        """
+        all_results = await self._find_places(city, business_type, radius, max_results)
+        if all_results is None:
+            return None
+
+        # Search results already carry the rating - drop low-rated places before fetching details
+        if min_rating > 0:
+            all_results = [place for place in all_results if (place.get('rating') or 0) >= min_rating]
+
+        # Nearby results already carry their details; the rest need a Place Details fetch
+        details_by_id = {
+            place.get('place_id', ''): place['_details'] for place in all_results if '_details' in place
+        }
+        missing_ids = [
+            place.get('place_id', '') for place in all_results if place.get('place_id', '') not in details_by_id
+        ]
+        if exclude_websites and missing_ids:
+            # Places with a real website are dropped anyway - check the website alone
+            # first and only pay for the full payload on the remaining candidates
+            websites = await self._get_places_details(missing_ids, fields=PLACE_WEBSITE_FIELDS)
+            missing_ids = [
+                place_id for place_id, details in zip(missing_ids, websites)
+                if not _is_functional_website(details.get('website', ''))
+            ]
+        return all_results, details_by_id, missing_ids
+
+    async def search_businesses(
         self, 
         city: str, 
         business_type: Optional[str] = None,
@@ -143,8 +552,8 @@ class GoogleMapsClient:
         Returns:
             List of business information dictionaries
         """
-        # Ensure client is available
-        self._ensure_client()
+        # Ensure client is available (may re-initialize, which does a blocking request)
+        await asyncio.to_thread(self._ensure_client)
 
         if not self.client:
             logger.info("Using mock data for business search - Google Maps client not available")
@@ -152,249 +561,28 @@ class GoogleMapsClient:
             return self._get_mock_results(city, business_type)
 
         try:
-            # First, get the city's location
-            geocode_result = self.client.geocode(city)
-            if not geocode_result:
-                logger.error(f"Could not find location for city: {city}")
+            found = await self._find_candidates(city, business_type, radius, min_rating, max_results, exclude_websites)
+            if found is None:
                 return self._get_mock_results(city, business_type)
-
-            location = geocode_result[0]['geometry']['location']
-            logger.info(f"Found location for {city}: {location}")
-
-            # Define common business types to search for if no specific type is provided
-            common_business_types = [
-                "restaurant", "cafe", "bar", "store", "shop", "retail", "salon",
-                "bakery", "grocery", "food", "service", "repair", "contractor",
-                "doctor", "dentist", "health", "fitness", "gym", "yoga", "spa",
-                "beauty", "hair", "nail", "barber", "massage", "therapy",
-                "auto", "car", "mechanic", "dealer", "parts", "tire", "detail",
-                "real estate", "property", "apartment", "home", "house", "rental",
-                "insurance", "financial", "bank", "accounting", "tax", "legal",
-                "attorney", "lawyer", "education", "school", "tutor", "daycare",
-                "child care", "pet", "veterinary", "animal", "landscaping", "lawn",
-                "cleaning", "maid", "janitorial", "plumber", "electrician", "hvac",
-                "construction", "roofing", "painting", "flooring", "furniture",
-                "clothing", "apparel", "jewelry", "accessory", "shoe", "tailor",
-                "electronics", "computer", "phone", "repair", "photography", "art",
-                "craft", "hobby", "toy", "game", "book", "music", "instrument",
-                "church", "religious", "nonprofit", "charity", "community",
-                "event", "venue", "catering", "party", "wedding", "funeral",
-                "moving", "storage", "shipping", "delivery", "transportation"
-            ]
-
-            all_results = []
-            processed_place_ids = set()  # To avoid duplicates
-
-            # If business_type is provided, only search for that type
-            search_types = [business_type] if business_type else common_business_types  # Use all business types
-
-            for search_type in search_types:
-                if len(all_results) >= max_results:
-                    break
-
-                # Build search query
-                if search_type:
-                    query = f"{search_type} in {city}"
-                else:
-                    query = f"businesses in {city}"
-
-                logger.info(f"Searching for: {query}")
-
-                # Try both places and places_nearby for more comprehensive results
-                search_methods = [
-                    # Text search
-                    lambda: self.client.places(
-                        query=query,
-                        location=location,
-                        radius=radius
-                    ),
-                    # Nearby search with type
-                    lambda: self.client.places_nearby(
-                        location=location,
-                        radius=radius,
-                        type=search_type if search_type and search_type in [
-                            "accounting", "airport", "amusement_park", "aquarium", "art_gallery",
-                            "atm", "bakery", "bank", "bar", "beauty_salon", "bicycle_store",
-                            "book_store", "bowling_alley", "bus_station", "cafe", "campground",
-                            "car_dealer", "car_rental", "car_repair", "car_wash", "casino",
-                            "cemetery", "church", "city_hall", "clothing_store", "convenience_store",
-                            "courthouse", "dentist", "department_store", "doctor", "drugstore",
-                            "electrician", "electronics_store", "embassy", "fire_station", "florist",
-                            "funeral_home", "furniture_store", "gas_station", "gym", "hair_care",
-                            "hardware_store", "hindu_temple", "home_goods_store", "hospital", "insurance_agency",
-                            "jewelry_store", "laundry", "lawyer", "library", "light_rail_station",
-                            "liquor_store", "local_government_office", "locksmith", "lodging", "meal_delivery",
-                            "meal_takeaway", "mosque", "movie_rental", "movie_theater", "moving_company",
-                            "museum", "night_club", "painter", "park", "parking", "pet_store", "pharmacy",
-                            "physiotherapist", "plumber", "police", "post_office", "primary_school",
-                            "real_estate_agency", "restaurant", "roofing_contractor", "rv_park", "school",
-                            "secondary_school", "shoe_store", "shopping_mall", "spa", "stadium", "storage",
-                            "store", "subway_station", "supermarket", "synagogue", "taxi_stand", "tourist_attraction",
-                            "train_station", "transit_station", "travel_agency", "university", "veterinary_care",
-                            "zoo"
-                        ] else None
-                    )
-                ]
-
-                for search_method in search_methods:
-                    try:
-                        places_result = search_method()
-
-                        results = places_result.get('results', [])
-                        logger.info(f"Found {len(results)} initial results for {search_type}")
-
-                        # Filter out duplicates
-                        new_results = [r for r in results if r.get('place_id') not in processed_place_ids]
-
-                        # Add place_ids to processed set
-                        for r in new_results:
-                            processed_place_ids.add(r.get('place_id'))
-
-                        all_results.extend(new_results)
-
-                        # Handle pagination to get more results
-                        next_page_token = places_result.get('next_page_token')
-                        while next_page_token and len(all_results) < max_results:
-                            import time
-                            # Wait a bit before requesting the next page (API requirement)
-                            time.sleep(2)
-
-                            # Get next page of results
-                            if "places" in search_method.__name__:
-                                next_page = self.client.places(
-                                    query=query,
-                                    location=location,
-                                    radius=radius,
-                                    page_token=next_page_token
-                                )
-                            else:
-                                next_page = self.client.places_nearby(
-                                    location=location,
-                                    radius=radius,
-                                    type=search_type if search_type and search_type in [
-                                        "accounting", "airport", "amusement_park", "aquarium", "art_gallery",
-                                        "atm", "bakery", "bank", "bar", "beauty_salon", "bicycle_store",
-                                        "book_store", "bowling_alley", "bus_station", "cafe", "campground",
-                                        "car_dealer", "car_rental", "car_repair", "car_wash", "casino",
-                                        "cemetery", "church", "city_hall", "clothing_store", "convenience_store",
-                                        "courthouse", "dentist", "department_store", "doctor", "drugstore",
-                                        "electrician", "electronics_store", "embassy", "fire_station", "florist",
-                                        "funeral_home", "furniture_store", "gas_station", "gym", "hair_care",
-                                        "hardware_store", "hindu_temple", "home_goods_store", "hospital", "insurance_agency",
-                                        "jewelry_store", "laundry", "lawyer", "library", "light_rail_station",
-                                        "liquor_store", "local_government_office", "locksmith", "lodging", "meal_delivery",
-                                        "meal_takeaway", "mosque", "movie_rental", "movie_theater", "moving_company",
-                                        "museum", "night_club", "painter", "park", "parking", "pet_store", "pharmacy",
-                                        "physiotherapist", "plumber", "police", "post_office", "primary_school",
-                                        "real_estate_agency", "restaurant", "roofing_contractor", "rv_park", "school",
-                                        "secondary_school", "shoe_store", "shopping_mall", "spa", "stadium", "storage",
-                                        "store", "subway_station", "supermarket", "synagogue", "taxi_stand", "tourist_attraction",
-                                        "train_station", "transit_station", "travel_agency", "university", "veterinary_care",
-                                        "zoo"
-                                    ] else None,
-                                    page_token=next_page_token
-                                )
-
-                            # Add new results
-                            new_page_results = next_page.get('results', [])
-
-                            # Filter out duplicates
-                            new_page_results = [r for r in new_page_results if r.get('place_id') not in processed_place_ids]
-
-                            # Add place_ids to processed set
-                            for r in new_page_results:
-                                processed_place_ids.add(r.get('place_id'))
-
-                            all_results.extend(new_page_results)
-                            logger.info(f"Added {len(new_page_results)} more results from next page for {search_type}")
-
-                            # Update token for next page (if any)
-                            next_page_token = next_page.get('next_page_token')
-
-                            # Break if we've reached max_results
-                            if len(all_results) >= max_results:
-                                break
-                    except Exception as e:
-                        logger.error(f"Error in search method for {search_type}: {e}")
-                        continue
-
-            logger.info(f"Total places found across all searches: {len(all_results)}")
+            all_results, details_by_id, missing_ids = found
+            details_by_id.update(zip(missing_ids, await self._get_places_details(missing_ids)))
 
             # Process results to get business details
             businesses = []
-            processed_businesses = set()  # To track businesses we've already processed
-
             for place in all_results:
                 if len(businesses) >= max_results:
                     break
 
                 place_id = place.get('place_id', '')
-
-                # Skip if we've already processed this business
-                if place_id in processed_businesses:
-                    continue
-
-                processed_businesses.add(place_id)
-
-                # Get detailed information
-                place_details = self._get_place_details(place_id)
+                place_details = details_by_id.get(place_id, {})
 
                 # Skip if no details found
                 if not place_details:
                     continue
 
-                # Filter by rating if specified
-                rating = place_details.get('rating', place.get('rating', 0))
-                if rating < min_rating:
-                    continue
-
-                # Handle website filtering if exclude_websites is True
-                website = place_details.get('website', '')
-
-                # More sophisticated website filtering:
-                # 1. If exclude_websites is False, include all businesses
-                # 2. If exclude_websites is True:
-                #    - Include businesses with no website field
-                #    - Include businesses with empty website strings
-                #    - Include businesses with potentially placeholder websites
-                if exclude_websites:
-                    # Check if website exists and appears to be a real website
-                    if website and all([
-                        # Basic checks for a functional website
-                        len(website) > 5,  # Longer than 5 chars
-                        "." in website,    # Has a domain extension
-                        not website.startswith("http://localhost"),  # Not a localhost
-                        not website.endswith("example.com"),  # Not an example domain
-                        not "placeholder" in website.lower(),  # Not a placeholder
-                        not "coming-soon" in website.lower(),  # Not a coming soon site
-                        not "under-construction" in website.lower(),  # Not under construction
-                    ]):
-                        # This appears to be a real, functional website - skip if excluding websites
-                        logger.debug(f"Skipping business with functional website: {place_details.get('name')}")
-                        continue
-
-                # Extract business information
-                business = {
-                    "place_id": place_id,
-                    "name": place_details.get('name', place.get('name', '')),
-                    "address": place_details.get('formatted_address', place.get('formatted_address', '')),
-                    "phone": place_details.get('formatted_phone_number', ''),
-                    "website": website,
-                    "rating": rating,
-                    "total_ratings": place_details.get('user_ratings_total', 0),
-                    "category": self._get_primary_category(place_details.get('types', place.get('types', []))),
-                    "price_level": place_details.get('price_level', 0),
-                    "is_open": self._get_open_status(place_details.get('opening_hours', {})),
-                    "location": {
-                        "lat": place.get('geometry', {}).get('location', {}).get('lat'),
-                        "lng": place.get('geometry', {}).get('location', {}).get('lng')
-                    }
-                }
-
-                # Only add businesses with valid information
-                if business["name"] and business["address"]:
+                business = self._build_business(place_id, place, place_details, min_rating, exclude_websites)
+                if business:
                     businesses.append(business)
-                    logger.debug(f"Added business: {business['name']}")
 
             logger.info(f"Found {len(businesses)} valid businesses in {city}")
             return businesses
@@ -403,43 +591,104 @@ class GoogleMapsClient:
             logger.error(f"Error searching businesses in {city}: {e}")
             return self._get_mock_results(city, business_type)
 
-# Global client instance - initialized lazily
-_maps_client = None
+    async def search_businesses_stream(
+        self,
+        city: str,
+        business_type: Optional[str] = None,
+        radius: int = 50000,
+        min_rating: float = 0.0,
+        max_results: int = 500,
+        exclude_websites: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Search like search_businesses, but yield each business as soon as it is ready.
 
-def _get_maps_client():
-    """Get or create the global maps client instance."""
-    global _maps_client
-    if _maps_client is None:
-        logger.info("Creating new GoogleMapsClient instance...")
-        _maps_client = GoogleMapsClient()
-    return _maps_client
+        Places whose details came with the search are yielded first, the rest in
+        the order their Place Details requests complete.
+        """
+        await asyncio.to_thread(self._ensure_client)
 
-def google_maps_search(
-    city: str, 
-    business_type: Optional[str] = None,
-    min_rating: float = 0.0,  # Changed to 0.0 to get all businesses
-    max_results: int = 500,  # Increased to 500 to get more results
-    exclude_websites: bool = True  # Add parameter to filter websites
-) -> Dict[str, Any]:
-    """
-    Enhanced Google Maps search for businesses in a specified city.
+        if not self.client:
+            for business in self._get_mock_results(city, business_type):
+                yield business
+            return
 
-    Args:
-        city: The name of the city to search in
-        business_type: Optional business type filter
-        min_rating: Minimum rating filter (default: 0.0)
-        max_results: Maximum number of results (default: 500)
-        exclude_websites: If True, only return businesses without websites (default: True)
+        tasks: List["asyncio.Task[tuple[str, Dict[str, Any]]]"] = []
+        try:
+            found = await self._find_candidates(city, business_type, radius, min_rating, max_results, exclude_websites)
+            if found is None:
+                for business in self._get_mock_results(city, business_type):
+                    yield business
+                return
+            all_results, details_by_id, missing_ids = found
+            places_by_id = {place.get('place_id', ''): place for place in all_results}
+
+            emitted = 0
+            for place_id, place_details in details_by_id.items():
+                business = self._build_business(place_id, places_by_id[place_id], place_details, min_rating, exclude_websites)
+                if business:
+                    yield business
+                    emitted += 1
+                    if emitted >= max_results:
+                        return
+
+            semaphore = asyncio.Semaphore(PLACE_DETAILS_CONCURRENCY)
+
+            async def fetch(place_id: str) -> tuple[str, Dict[str, Any]]:
+                return place_id, await self._get_place_details(place_id, semaphore)
+
+            tasks = [asyncio.create_task(fetch(place_id)) for place_id in missing_ids]
+            for next_done in asyncio.as_completed(tasks):
+                place_id, place_details = await next_done
+                if not place_details:
+                    continue
+                business = self._build_business(place_id, places_by_id[place_id], place_details, min_rating, exclude_websites)
+                if business:
+                    yield business
+                    emitted += 1
+                    if emitted >= max_results:
+                        return
+        except Exception as e:
+            logger.error(f"Error streaming businesses in {city}: {e}")
+        finally:
+            # Stop outstanding lookups once the limit is hit or the consumer goes away
+            for task in tasks:
+                task.cancel()
+
+def _save_results_to_state(tool_context: Optional[ToolContext], result: Dict[str, Any]) -> None:
+    """Append search results to session state so MergerAgent can merge them without an LLM."""
+    if tool_context is not None:
+        tool_context.state[MAPS_RESULTS_STATE_KEY] = (
+            tool_context.state.get(MAPS_RESULTS_STATE_KEY, []) + result["results"]
+        )
 
-    Returns:
-        A dictionary containing search results and metadata
-    """
+# Global client instance - initialized lazily, only when a real search runs
+@lru_cache(maxsize=1)
+def _get_maps_client() -> GoogleMapsClient:
+    """Get or create the global maps client instance."""
+    logger.info("Creating new GoogleMapsClient instance...")
+    return GoogleMapsClient()
+
+def _maps_client_created() -> bool:
+    """Whether the global maps client has been built yet."""
+    return _get_maps_client.cache_info().currsize > 0
+
+async def _run_search(
+    city: str,
+    business_type: Optional[str],
+    min_rating: float,
+    max_results: int,
+    exclude_websites: bool,
+    cache_key: tuple
+) -> Dict[str, Any]:
+    """Run one Google Maps search and cache successful API results."""
     try:
-        # Get the client instance (lazy initialization)
-        maps_client = _get_maps_client()
+        # Get the client instance (lazy initialization blocks on a test geocode, so
+        # build it off the event loop)
+        maps_client = _get_maps_client() if _maps_client_created() else await asyncio.to_thread(_get_maps_client)
 
         # Search for businesses
-        businesses = maps_client.search_businesses(
+        businesses = await maps_client.search_businesses(
             city=city,
             business_type=business_type,
             min_rating=min_rating,
@@ -449,7 +698,7 @@ def google_maps_search(
 
         # No need to filter again as it's already done in search_businesses
 
-        return {
+        result = {
             "status": "success",
             "total_results": len(businesses),
             "results": businesses,
@@ -463,9 +712,17 @@ def google_maps_search(
             }
         }
 
+        # Only cache real API results, never mock data
+        if maps_client.client is not None:
+            _search_cache[cache_key] = (time.monotonic(), orjson.dumps(result))
+            if len(_search_cache) > SEARCH_CACHE_MAXSIZE:
+                _search_cache.popitem(last=False)
+
+        return result
+
     except Exception as e:
         logger.error(f"Error in google_maps_search: {e}")
-        maps_client = _get_maps_client() if '_maps_client' in globals() and _maps_client else None
+        maps_client = _get_maps_client() if _maps_client_created() else None
         return {
             "status": "error",
             "message": str(e),
@@ -481,14 +738,107 @@ def google_maps_search(
             }
         }
 
+
+async def google_maps_search(
+    city: str, 
+    business_type: Optional[str] = None,
+    min_rating: float = 0.0,  # Changed to 0.0 to get all businesses
+    max_results: int = 500,  # Increased to 500 to get more results
+    exclude_websites: bool = True,  # Add parameter to filter websites
+    tool_context: ToolContext = None
+) -> Dict[str, Any]:
+    """
+    Enhanced Google Maps search for businesses in a specified city.
+
+    Args:
+        city: The name of the city to search in
+        business_type: Optional business type filter
+        min_rating: Minimum rating filter (default: 0.0)
+        max_results: Maximum number of results (default: 500)
+        exclude_websites: If True, only return businesses without websites (default: True)
+        tool_context: Tool execution context, used to keep results in session state
+
+    Returns:
+        A dictionary containing search results and metadata
+    """
+    cache_key = (" ".join(city.split()).casefold(), business_type, min_rating, max_results, exclude_websites)
+    cached = _search_cache.get(cache_key)
+    if cached is not None:
+        cached_at, cached_payload = cached
+        if time.monotonic() - cached_at < SEARCH_CACHE_TTL:
+            _search_cache.move_to_end(cache_key)
+            logger.info(f"Returning cached Google Maps results for {city}")
+            cached_result = orjson.loads(cached_payload)
+            _save_results_to_state(tool_context, cached_result)
+            return cached_result
+        del _search_cache[cache_key]
+
+    # Concurrent identical searches share one upstream fetch
+    inflight = _inflight_searches.get(cache_key)
+    if inflight is not None:
+        logger.info(f"Joining in-flight Google Maps search for {city}")
+        try:
+            shared_result = await asyncio.shield(inflight)
+        except asyncio.CancelledError:
+            if not inflight.cancelled():
+                # This caller was cancelled itself
+                raise
+            # Only the leading search was cancelled; run the search for this caller instead
+            result = await _run_search(city, business_type, min_rating, max_results, exclude_websites, cache_key)
+        else:
+            # Joiners get their own copy, like cache hits, so callers never share one dict
+            result = orjson.loads(orjson.dumps(shared_result))
+    else:
+        inflight = asyncio.get_running_loop().create_future()
+        _inflight_searches[cache_key] = inflight
+        try:
+            result = await _run_search(city, business_type, min_rating, max_results, exclude_websites, cache_key)
+        except asyncio.CancelledError:
+            inflight.cancel()
+            raise
+        except BaseException as exc:
+            inflight.set_exception(exc)
+            # Joiners re-raise it; mark it retrieved so a search nobody joined is not logged twice
+            inflight.exception()
+            raise
+        else:
+            inflight.set_result(result)
+        finally:
+            del _inflight_searches[cache_key]
+
+    _save_results_to_state(tool_context, result)
+    return result
+
+async def google_maps_search_stream(
+    city: str,
+    business_type: Optional[str] = None,
+    min_rating: float = 0.0,
+    max_results: int = 500,
+    exclude_websites: bool = True
+) -> AsyncIterator[bytes]:
+    """
+    Stream Google Maps search results as NDJSON, one business per line.
+
+    Unlike google_maps_search, results are not cached or kept in session state.
+    """
+    maps_client = _get_maps_client() if _maps_client_created() else await asyncio.to_thread(_get_maps_client)
+    async for business in maps_client.search_businesses_stream(
+        city=city,
+        business_type=business_type,
+        min_rating=min_rating,
+        max_results=max_results,
+        exclude_websites=exclude_websites
+    ):
+        yield orjson.dumps(business) + b"\n"
+
 # Enhanced function tool with support for multiple search types
-def google_maps_nearby_search(city: str, business_type: str = "restaurant") -> Dict[str, Any]:
+async def google_maps_nearby_search(city: str, business_type: str = "restaurant") -> Dict[str, Any]:
     """Search for specific business types nearby."""
-    return google_maps_search(city, business_type=business_type)
+    return await google_maps_search(city, business_type=business_type)
 
-def google_maps_high_rated_search(city: str, min_rating: float = 4.0) -> Dict[str, Any]:
+async def google_maps_high_rated_search(city: str, min_rating: float = 4.0) -> Dict[str, Any]:
     """Search for highly-rated businesses."""
-    return google_maps_search(city, min_rating=min_rating)
+    return await google_maps_search(city, min_rating=min_rating)
 
 # Create function tools
 google_maps_search_tool = FunctionTool(func=google_maps_search)
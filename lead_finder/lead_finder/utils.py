@@ -2,8 +2,33 @@
 Utility functions for the Lead Finder Agent.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import json
+import socket
+import uuid
+
+import httpx
+
+# Disable Nagle's algorithm so small request bodies are sent immediately
+_SOCKET_OPTIONS = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+
+def make_http_client(limits: Optional[httpx.Limits] = None) -> httpx.AsyncClient:
+    """
+    Build a long-lived async HTTP client with HTTP/2, TCP_NODELAY and keep-alive.
+    
+    Args:
+        limits: Optional connection pool limits
+        
+    Returns:
+        Configured httpx.AsyncClient
+    """
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=1,
+        socket_options=_SOCKET_OPTIONS,
+        limits=limits or httpx.Limits(max_keepalive_connections=16, keepalive_expiry=30.0),
+    )
+    return httpx.AsyncClient(transport=transport, timeout=httpx.Timeout(10.0, connect=3.0))
 
 def deduplicate_businesses(businesses: List[dict[str, Any]]) -> List[dict[str, Any]]:
     """
@@ -30,6 +55,40 @@ def deduplicate_businesses(businesses: List[dict[str, Any]]) -> List[dict[str, A
     
     return list(unique_businesses.values())
 
+def merge_and_dedup(*result_lists: List[dict[str, Any]]) -> List[dict[str, Any]]:
+    """
+    Merge business lists from several searches and deduplicate them.
+    
+    Businesses are keyed on case- and whitespace-insensitive name and address;
+    later duplicates only fill in fields that are still empty. Each merged
+    business gets a stable id derived from its key.
+    
+    Args:
+        *result_lists: Business lists to merge, in priority order
+        
+    Returns:
+        Merged, deduplicated list of businesses
+    """
+    merged: Dict[tuple, dict[str, Any]] = {}
+    for businesses in result_lists:
+        for business in businesses:
+            key = (
+                (business.get("name") or "").strip().lower(),
+                (business.get("address") or "").strip().lower(),
+            )
+            existing = merged.get(key)
+            if existing is None:
+                merged[key] = dict(business)
+                continue
+            for field, value in business.items():
+                if not existing.get(field):
+                    existing[field] = value
+
+    for key, business in merged.items():
+        business.setdefault("id", str(uuid.uuid5(uuid.NAMESPACE_URL, "|".join(key))))
+
+    return list(merged.values())
+
 def format_business_for_bigquery(business: dict[str, Any]) -> dict[str, Any]:
     """
     Format business data for BigQuery upload.
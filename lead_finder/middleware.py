@@ -0,0 +1,28 @@
+"""
+HTTP middleware for the Lead Finder server.
+"""
+from typing import Iterable
+
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class StreamingAwareGZipMiddleware:
+    """
+    GZip middleware that leaves streaming endpoints uncompressed.
+
+    Starlette's gzip responder buffers compressed bytes inside zlib until a large
+    block builds up, so NDJSON lines would not reach the client as they are yielded.
+    Requests to `exclude_paths` bypass compression; everything else is gzipped as usual.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 500, exclude_paths: Iterable[str] = ()) -> None:
+        self.app = app
+        self.gzip_app = GZipMiddleware(app, minimum_size=minimum_size)
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+        else:
+            await self.gzip_app(scope, receive, send)
@@ -0,0 +1,47 @@
+"""
+Plain HTTP routes served alongside the Lead Finder A2A application.
+"""
+import orjson
+from starlette.responses import Response, StreamingResponse
+
+from .lead_finder.tools.maps_search import MAX_SEARCH_RESULTS, google_maps_search_stream
+
+# Pre-serialized health payload so load-balancer probes skip JSON encoding
+_HEALTH_BODY = b'{"status":"healthy","service":"lead_finder"}'
+
+
+async def health_check(request):
+    """Simple health check endpoint"""
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+
+def _bad_request(message: str) -> Response:
+    """Return a 400 JSON error response."""
+    return Response(content=orjson.dumps({"error": message}), status_code=400, media_type="application/json")
+
+
+async def find_leads(request):
+    """Stream Google Maps leads for a city as NDJSON, one business per line."""
+    try:
+        payload = await request.json()
+    except ValueError:
+        return _bad_request("request body must be JSON")
+    if not isinstance(payload, dict):
+        return _bad_request("request body must be a JSON object")
+
+    city = payload.get("city")
+    city = " ".join(city.split()) if isinstance(city, str) else ""
+    if not city:
+        return _bad_request("city is required")
+
+    try:
+        max_results = int(payload.get("max_results", 50))
+    except (ValueError, TypeError):
+        return _bad_request("max_results must be an integer")
+    # Keep the search within the tool's range
+    max_results = min(max(max_results, 1), MAX_SEARCH_RESULTS)
+
+    return StreamingResponse(
+        google_maps_search_stream(city, business_type=payload.get("business_type"), max_results=max_results),
+        media_type="application/x-ndjson",
+    )
@@ -0,0 +1,122 @@
+"""
+Tests for the Lead Finder HTTP middleware.
+
+Run tests with:
+    pytest lead_finder/test/test_middleware.py -v
+"""
+
+import asyncio
+import gzip
+import pytest
+
+# Import the middleware
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from starlette.applications import Starlette
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Route
+
+from lead_finder.middleware import StreamingAwareGZipMiddleware
+
+
+def _build_app(release: asyncio.Event) -> StreamingAwareGZipMiddleware:
+    """Build an app whose NDJSON stream blocks after its first line until released."""
+
+    async def leads():
+        yield b'{"name":"First Lead"}\n'
+        await release.wait()
+        yield b'{"name":"Second Lead"}\n'
+
+    async def find_leads(request):
+        return StreamingResponse(leads(), media_type="application/x-ndjson")
+
+    async def large(request):
+        return Response(content=b"x" * 4096, media_type="text/plain")
+
+    app = Starlette(routes=[
+        Route("/find_leads", find_leads, methods=["POST"]),
+        Route("/large", large, methods=["GET"]),
+    ])
+    return StreamingAwareGZipMiddleware(app, minimum_size=1024, exclude_paths=("/find_leads",))
+
+
+def _scope(method: str, path: str) -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"accept-encoding", b"gzip"), (b"host", b"testserver")],
+        "client": ("testclient", 50000),
+        "server": ("testserver", 80),
+    }
+
+
+def _receive():
+    """ASGI receive that delivers an empty request body, then waits like an open connection."""
+    sent = False
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.Event().wait()
+
+    return receive
+
+
+class TestStreamingAwareGZipMiddleware:
+    """Test class for the Lead Finder gzip middleware."""
+
+    @pytest.mark.asyncio
+    async def test_find_leads_first_line_arrives_before_stream_ends(self):
+        """The first NDJSON line reaches the client while the generator is still running."""
+        release = asyncio.Event()
+        app = _build_app(release)
+        messages: asyncio.Queue = asyncio.Queue()
+
+        receive = _receive()
+
+        async def send(message):
+            await messages.put(message)
+
+        task = asyncio.create_task(app(_scope("POST", "/find_leads"), receive, send))
+        try:
+            start = await asyncio.wait_for(messages.get(), timeout=1)
+            assert start["type"] == "http.response.start"
+            headers = dict(start["headers"])
+            assert b"content-encoding" not in headers
+
+            first = await asyncio.wait_for(messages.get(), timeout=1)
+            assert first["body"] == b'{"name":"First Lead"}\n'
+            assert first.get("more_body") is True
+            assert not task.done()
+        finally:
+            release.set()
+            await asyncio.wait_for(task, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_other_routes_are_still_gzipped(self):
+        """Responses outside the excluded paths keep gzip compression."""
+        app = _build_app(asyncio.Event())
+        messages = []
+
+        receive = _receive()
+
+        async def send(message):
+            messages.append(message)
+
+        await app(_scope("GET", "/large"), receive, send)
+
+        headers = dict(messages[0]["headers"])
+        assert headers[b"content-encoding"] == b"gzip"
+        body = b"".join(message.get("body", b"") for message in messages[1:])
+        assert gzip.decompress(body) == b"x" * 4096
@@ -0,0 +1,105 @@
+"""
+Tests for the Lead Finder plain HTTP routes.
+
+Run tests with:
+    pytest lead_finder/test/test_routes.py -v
+"""
+
+import json
+import pytest
+from unittest.mock import patch
+
+# Import the routes
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from starlette.applications import Starlette
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from lead_finder.routes import find_leads, health_check
+from lead_finder.lead_finder.tools.maps_search import GoogleMapsClient, MAX_SEARCH_RESULTS
+
+
+class TestFindLeadsRoute:
+    """Test class for the /find_leads NDJSON route."""
+
+    @pytest.fixture
+    def search_calls(self):
+        """Stub out the Maps search and record the arguments of each call."""
+        calls = []
+
+        async def fake_search_businesses_stream(self, **kwargs):
+            calls.append(kwargs)
+            yield {"name": "First Lead", "city": kwargs["city"]}
+            yield {"name": "Second Lead", "city": kwargs["city"]}
+
+        with patch.object(GoogleMapsClient, "search_businesses_stream", fake_search_businesses_stream):
+            yield calls
+
+    @pytest.fixture
+    def client(self):
+        """Create a test client for the lead finder routes."""
+        app = Starlette(routes=[
+            Route("/health", health_check, methods=["GET"]),
+            Route("/find_leads", find_leads, methods=["POST"]),
+        ])
+        return TestClient(app)
+
+    def test_health_check(self, client):
+        """Test the health check endpoint."""
+        response = client.get("/health")
+        assert response.status_code == 200
+        assert response.json() == {"status": "healthy", "service": "lead_finder"}
+
+    def test_find_leads_streams_ndjson(self, client, search_calls):
+        """Test that each business is sent as one NDJSON line."""
+        response = client.post("/find_leads", json={"city": "  New   York "})
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["name"] for line in lines] == ["First Lead", "Second Lead"]
+        assert search_calls[0]["city"] == "New York"
+        assert search_calls[0]["max_results"] == 50
+
+    def test_find_leads_missing_city(self, client, search_calls):
+        """Test that a request without a city is rejected."""
+        response = client.post("/find_leads", json={"max_results": 10})
+        assert response.status_code == 400
+        assert response.json() == {"error": "city is required"}
+        assert search_calls == []
+
+    def test_find_leads_blank_city(self, client, search_calls):
+        """Test that a whitespace-only city is rejected."""
+        response = client.post("/find_leads", json={"city": "   "})
+        assert response.status_code == 400
+        assert response.json() == {"error": "city is required"}
+
+    def test_find_leads_invalid_max_results(self, client, search_calls):
+        """Test that a non-integer max_results gets its own error message."""
+        response = client.post("/find_leads", json={"city": "Boston", "max_results": "many"})
+        assert response.status_code == 400
+        assert response.json() == {"error": "max_results must be an integer"}
+        assert search_calls == []
+
+    def test_find_leads_invalid_json(self, client, search_calls):
+        """Test that a body that is not JSON is rejected."""
+        response = client.post(
+            "/find_leads", content=b"city=Boston", headers={"Content-Type": "application/json"}
+        )
+        assert response.status_code == 400
+        assert response.json() == {"error": "request body must be JSON"}
+
+    @pytest.mark.parametrize("requested, expected", [
+        (0, 1),
+        (-5, 1),
+        (10, 10),
+        (MAX_SEARCH_RESULTS + 1, MAX_SEARCH_RESULTS),
+        (10_000_000, MAX_SEARCH_RESULTS),
+    ])
+    def test_find_leads_clamps_max_results(self, client, search_calls, requested, expected):
+        """Test that max_results is clamped to the search tool's range."""
+        response = client.post("/find_leads", json={"city": "Boston", "max_results": requested})
+        assert response.status_code == 200
+        assert search_calls[0]["max_results"] == expected
@@ -7,6 +7,7 @@ from a2a.server.tasks import InMemoryTaskStore
 from a2a.types import AgentCapabilities, AgentCard, AgentSkill
 
 from .agent_executor import LeadManagerAgentExecutor
+from .lead_manager.callbacks import flush_ui_updates
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -79,8 +80,12 @@ def main(host: str, port: int):
     # Start the Server
     import uvicorn
 
+    app = app_builder.build()
+    # Send any queued UI notifications before the server exits
+    app.add_event_handler("shutdown", flush_ui_updates)
+
     logger.info(f"Starting Lead Manager A2A server on http://{host}:{port}/")
-    uvicorn.run(app_builder.build(), host=host, port=port)
+    uvicorn.run(app, host=host, port=port)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
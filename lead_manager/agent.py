@@ -3,7 +3,14 @@ Main entry point for the Lead Manager Agent.
 Imports the properly structured Sequential Agent.
 """
 
-from .lead_manager.agent import root_agent
+from .lead_manager.agent import get_root_agent
+
+
+def __getattr__(name: str):
+    # The root agent is built on first access rather than at import time
+    if name == "root_agent":
+        return get_root_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Export the root agent for use by the agent executor
-__all__ = ['root_agent']
\ No newline at end of file
+__all__ = ['root_agent', 'get_root_agent']
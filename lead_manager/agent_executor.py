@@ -1,4 +1,3 @@
-import json
 import logging
 from typing import Any
 from datetime import datetime
@@ -8,6 +7,7 @@ from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.events import EventQueue
 from a2a.server.tasks import TaskUpdater
 from a2a.types import DataPart, Part
+import orjson
 
 from google.adk import Runner
 from google.adk.artifacts import InMemoryArtifactService
@@ -15,7 +15,7 @@ from google.adk.memory import InMemoryMemoryService
 from google.adk.sessions import InMemorySessionService, Session
 from google.genai import types as genai_types
 
-from .agent import root_agent as lead_manager_adk_agent
+from .agent import get_root_agent
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +39,7 @@ class LeadManagerAgentExecutor(AgentExecutor):
     """Executes the Lead Manager ADK agent logic in response to A2A requests."""
 
     def __init__(self):
-        self._adk_agent = lead_manager_adk_agent
+        self._adk_agent = get_root_agent()
         self._adk_runner = Runner(
             app_name="lead_manager_adk_runner",
             agent=self._adk_agent,
@@ -96,7 +96,7 @@ class LeadManagerAgentExecutor(AgentExecutor):
             "query": search_query,
             "ui_client_url": ui_client_url
         }
-        agent_input_json = json.dumps(agent_input_dict)
+        agent_input_json = orjson.dumps(agent_input_dict).decode()
         adk_content = genai_types.Content(
             parts=[genai_types.Part(text=agent_input_json)]
         )
@@ -158,21 +158,16 @@ class LeadManagerAgentExecutor(AgentExecutor):
                 session_id=session_id_for_adk,
                 new_message=adk_content,
             ):
-                log_entry = f" ** - - - - - ** \n [Event] Author: {event.author}, \n Type: {type(event).__name__}, \n Final: {event.is_final_response()}, \n Content: {event.content}"
-                log_to_file(log_entry)
+                # The per-event trace file is a debugging aid; skip formatting and file I/O otherwise
+                if logger.isEnabledFor(logging.DEBUG):
+                    log_to_file(f" ** - - - - - ** \n [Event] Author: {event.author}, \n Type: {type(event).__name__}, \n Final: {event.is_final_response()}, \n Content: {event.content}")
                 
                 if event.is_final_response():
-                    if event.content and event.content.parts:
-                        text_part = next(
-                            (
-                                p
-                                for p in event.content.parts
-                                if hasattr(p, "text") and p.text
-                            ),
-                            None,
-                        )
-                        if text_part:
-                            final_result["message"] = text_part.text
+                    # One attribute chain; content or parts may be missing
+                    parts = getattr(event.content, "parts", None) or ()
+                    final_text = next((p.text for p in parts if getattr(p, "text", None)), None)
+                    if final_text:
+                        final_result["message"] = final_text
 
             task_updater.add_artifact(
                 parts=[Part(root=DataPart(data=final_result))],
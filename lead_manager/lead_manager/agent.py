@@ -2,23 +2,34 @@
 Main agent definition for the Lead Manager Agent.
 """
 
+from functools import cache
+
 from google.adk.agents.sequential_agent import SequentialAgent
 from .config import MODEL
-from .sub_agents.email_checker_agent import email_checker_agent
-from .sub_agents.email_analyzer_instance import email_analyzer
-from .sub_agents.post_action_agent import post_action_agent
-from .callbacks import post_lead_manager_callback
 
-# Create the root agent (LeadManagerAgent)
-lead_manager_agent = SequentialAgent(
-    name="LeadManagerAgent",
-    description="Sequential agent for managing hot leads through email monitoring, meeting scheduling, and UI notifications",
-    sub_agents=[
-        email_checker_agent,
-        email_analyzer,
-        post_action_agent
-    ],
-    after_agent_callback=post_lead_manager_callback,
-)
 
-root_agent = lead_manager_agent
\ No newline at end of file
+@cache
+def get_root_agent() -> SequentialAgent:
+    """Create the root agent (LeadManagerAgent) and its sub-agents on first use."""
+    from .sub_agents.email_checker_agent import email_checker_agent
+    from .sub_agents.email_analyzer_instance import email_analyzer
+    from .sub_agents.post_action_agent import post_action_agent
+    from .callbacks import post_lead_manager_callback
+
+    return SequentialAgent(
+        name="LeadManagerAgent",
+        description="Sequential agent for managing hot leads through email monitoring, meeting scheduling, and UI notifications",
+        sub_agents=[
+            email_checker_agent,
+            email_analyzer,
+            post_action_agent
+        ],
+        after_agent_callback=post_lead_manager_callback,
+    )
+
+
+def __getattr__(name: str):
+    # ADK agent discovery looks up root_agent by name; build it only when asked for
+    if name in ("root_agent", "lead_manager_agent"):
+        return get_root_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,14 +1,15 @@
 """
 Callbacks for the Lead Manager Agent.
 """
-import json
+import asyncio
 import logging
-import os
 import re
-from typing import Optional, Dict, Any
+from itertools import islice
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 
 import httpx
+import orjson
 import common.config as config
 
 from google.adk.agents.callback_context import CallbackContext
@@ -16,82 +17,176 @@ from google.genai import types as genai_types
 
 logger = logging.getLogger(__name__)
 
+# Markdown-fenced JSON block as returned by LLM agents
+_JSON_BLOCK_RE = re.compile(r"```json\s*(.*?)\s*```", re.DOTALL)
 
-def send_calendar_notification_to_ui(calendar_request: Dict[str, Any]) -> None:
+_CALLBACK_ENDPOINT = f"{config.ui_client_url()}/agent_callback"
+_BULK_CALLBACK_ENDPOINT = f"{config.ui_client_url()}/agent_callbacks_bulk"
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Payload fields shared by every notification of each kind
+_CALENDAR_STATIC_FIELDS = {"agent_type": "calendar", "status": "meeting_scheduled"}
+_HOT_LEAD_STATIC_FIELDS = {"agent_type": "lead_manager", "status": "converting"}
+
+# Shared async client so UI notifications reuse pooled keep-alive connections
+# without blocking the event loop; HTTP/2 multiplexes them when the UI is served over TLS
+_UI_CLIENT = httpx.AsyncClient(
+    http2=True,
+    timeout=10.0,
+    limits=httpx.Limits(max_connections=16, max_keepalive_connections=16, keepalive_expiry=30.0),
+)
+
+# Hot lead notifications are queued and sent in bulk by a background task on the agent's event loop
+UI_BULK_MAX_BATCH = 32
+_UPDATE_QUEUE_MAXSIZE = 1_000
+_FLUSH_LINGER = 0.05
+_update_queue: Optional[asyncio.Queue] = None
+_flusher_task: Optional[asyncio.Task] = None
+
+
+async def _post_hot_lead_batch(batch: List[Dict[str, Any]]):
+    """Posts a batch of hot lead notifications to the UI client's bulk endpoint."""
+    payload = {"agent_type": "lead_manager", "updates": batch}
+    try:
+        response = await _UI_CLIENT.post(_BULK_CALLBACK_ENDPOINT, content=orjson.dumps(payload), headers=_JSON_HEADERS)
+        response.raise_for_status()
+        logger.debug("Successfully posted %s hot lead notifications to UI. Status: %s", len(batch), response.status_code)
+    except httpx.RequestError as e:
+        logger.error("Error sending POST request to UI client at %s: %s", e.request.url if hasattr(e, 'request') else 'unknown', e)
+    except Exception as e:
+        logger.error("An unexpected error occurred while posting hot leads to UI client: %s", e)
+
+
+async def _flusher(queue: asyncio.Queue):
+    """
+    Background task that coalesces queued hot lead notifications into bulk UI POSTs.
+    Waits up to _FLUSH_LINGER seconds for more notifications before sending a batch.
+    """
+    while True:
+        batch = [await queue.get()]
+        try:
+            while len(batch) < UI_BULK_MAX_BATCH:
+                batch.append(await asyncio.wait_for(queue.get(), timeout=_FLUSH_LINGER))
+        except asyncio.TimeoutError:
+            pass
+        try:
+            await _post_hot_lead_batch(batch)
+        finally:
+            for _ in batch:
+                queue.task_done()
+
+
+def _get_update_queue() -> asyncio.Queue:
+    """Returns the UI notification queue, starting its flusher on the running loop if needed."""
+    global _update_queue, _flusher_task
+    if _update_queue is None:
+        _update_queue = asyncio.Queue(maxsize=_UPDATE_QUEUE_MAXSIZE)
+    if _flusher_task is None or _flusher_task.done():
+        # Restart a dead flusher on the same queue so notifications still waiting in it are sent
+        _flusher_task = asyncio.get_running_loop().create_task(_flusher(_update_queue))
+    return _update_queue
+
+
+async def flush_ui_updates(timeout: float = 5.0):
+    """Waits until queued UI notifications have been sent, e.g. on shutdown."""
+    if _update_queue is None:
+        return
+    try:
+        await asyncio.wait_for(_update_queue.join(), timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.warning("Timed out flushing %s pending UI notifications", _update_queue.qsize())
+
+
+async def send_calendar_notification_to_ui(calendar_request: Dict[str, Any]) -> None:
     """
     Sends a calendar notification to the UI client's /agent_callback endpoint.
     Shows unread calendar requests in the lead-manager-content section.
     """
-    ui_client_url = os.environ.get(
-        "UI_CLIENT_SERVICE_URL", config.DEFAULT_UI_CLIENT_URL
-    ).rstrip("/")
-    callback_endpoint = f"{ui_client_url}/agent_callback"
+    callback_endpoint = _CALLBACK_ENDPOINT
     
     payload = {
-        "agent_type": "calendar",
+        **_CALENDAR_STATIC_FIELDS,
         "business_id": calendar_request.get("business_id", "unknown_business"),
-        "status": "meeting_scheduled",
         "message": f"Incoming meeting with {calendar_request.get('sender_email', 'unknown')}",
         "timestamp": datetime.now().isoformat(),
         "data": calendar_request
     }
     
-    logger.info(f"Sending calendar notification to UI endpoint: {callback_endpoint}")
+    logger.debug("Sending calendar notification to UI endpoint: %s", callback_endpoint)
     try:
-        with httpx.Client() as client:
-            response = client.post(callback_endpoint, json=payload, timeout=10.0)
-            response.raise_for_status()
-            logger.info(f"Successfully posted calendar notification to UI. Status: {response.status_code}")
+        response = await _UI_CLIENT.post(callback_endpoint, content=orjson.dumps(payload), headers=_JSON_HEADERS)
+        response.raise_for_status()
+        logger.debug("Successfully posted calendar notification to UI. Status: %s", response.status_code)
     except httpx.RequestError as e:
-        logger.error(f"Error sending POST request to UI client at {e.request.url if hasattr(e, 'request') else 'unknown'}: {e}")
+        logger.error("Error sending POST request to UI client at %s: %s", e.request.url if hasattr(e, 'request') else 'unknown', e)
     except Exception as e:
-        logger.error(f"An unexpected error occurred while posting calendar notification to UI client: {e}")
+        logger.error("An unexpected error occurred while posting calendar notification to UI client: %s", e)
 
-def send_hot_lead_to_ui(email_data: Dict[str, Any]):
+async def send_hot_lead_to_ui(email_data: Dict[str, Any]):
     """
-    Sends a hot lead email notification to the UI client's /agent_callback endpoint.
+    Queues a hot lead email notification for the UI client's /agent_callbacks_bulk
+    endpoint and returns immediately; a background flusher sends them in batches.
     Shows unread hot lead emails in the lead-manager-content section.
     """
-    ui_client_url = os.environ.get(
-        "UI_CLIENT_SERVICE_URL", config.DEFAULT_UI_CLIENT_URL
-    ).rstrip("/")
-    callback_endpoint = f"{ui_client_url}/agent_callback"
-    
     # Extract email info
     sender_email = email_data.get("sender_email_address", "") or email_data.get("sender_email", "")
     subject = email_data.get("subject", "No Subject")
     body = email_data.get("body", "")
     
-    # Get first few words from body for preview
-    body_preview = " ".join(body.split()[:15]) + "..." if len(body.split()) > 15 else body
-    
+    # Get first few words from body for preview (maxsplit stops after 15 words)
+    words = body.split(None, 15)
+    body_preview = " ".join(islice(words, 15)) + "..." if len(words) > 15 else body
+
+    # Only split the address when the email carries no sender name
+    sender_name = email_data.get("sender_name")
+    if sender_name is None:
+        sender_name = sender_email.split('@')[0]
+
+    # One clock read serves both the update timestamp and the received-date fallback
+    now_iso = datetime.now().isoformat()
+
     payload = {
-        "agent_type": "lead_manager",
+        **_HOT_LEAD_STATIC_FIELDS,
         "business_id": f"hot_lead_{hash(sender_email)}",
-        "status": "converting",
         "message": f"Hot lead email from {sender_email}",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now_iso,
         "data": {
             "sender_email": sender_email,
-            "sender_name": email_data.get("sender_name", sender_email.split('@')[0]),
+            "sender_name": sender_name,
             "subject": subject,
             "body_preview": body_preview,
-            "received_date": email_data.get("date", datetime.now().isoformat()),
+            "received_date": email_data.get("date", now_iso),
             "message_id": email_data.get("message_id", ""),
             "type": "hot_lead_email"
         }
     }
 
-    logger.info(f"Sending hot lead notification to UI endpoint: {callback_endpoint} for email: {sender_email}")
+    queue = _get_update_queue()
+    if queue.full():
+        # Drop the oldest notification rather than blocking the agent
+        queue.get_nowait()
+        queue.task_done()
+        logger.warning("UI notification queue is full, dropping the oldest hot lead")
+    queue.put_nowait(payload)
+    logger.debug("Queued hot lead notification for UI: %s", sender_email)
+
+def _safe_json_parse(value: Any, key_name: str) -> Any:
+    """Parse a state value that may be JSON, optionally wrapped in a ```json fence."""
+    if not isinstance(value, str):
+        return value # It's already an object, return as-is
+
+    cleaned_str = value.strip()
+    # Only fenced values need the regex; plain JSON goes straight to the decoder
+    if "```json" in cleaned_str:
+        match = _JSON_BLOCK_RE.search(cleaned_str)
+        if match:
+            cleaned_str = match.group(1)
+
     try:
-        with httpx.Client() as client:
-            response = client.post(callback_endpoint, json=payload, timeout=10.0)
-            response.raise_for_status()
-            logger.info(f"Successfully posted hot lead notification to UI. Status: {response.status_code}")
-    except httpx.RequestError as e:
-        logger.error(f"Error sending POST request to UI client at {e.request.url if hasattr(e, 'request') else 'unknown'}: {e}")
-    except Exception as e:
-        logger.error(f"An unexpected error occurred while posting hot lead to UI client: {e}")
+        return orjson.loads(cleaned_str)
+    except orjson.JSONDecodeError:
+        logger.warning("[Callback] Could not parse '%s' as JSON. Using raw string value.", key_name)
+        return value # Return the original string if parsing fails
 
 async def post_lead_manager_callback(callback_context: CallbackContext) -> Optional[genai_types.Content]:
     """
@@ -99,34 +194,20 @@ async def post_lead_manager_callback(callback_context: CallbackContext) -> Optio
     This version includes robust parsing for all potential JSON strings from the context.
     """
     agent_name = callback_context.agent_name
-    logger.info(f"[Callback] Exiting agent: {agent_name}. Processing final result.")
+    logger.info("[Callback] Exiting agent: %s. Processing final result.", agent_name)
 
-    context_state = callback_context.state.to_dict()
-    logger.info(f"[Callback] Current callback_context.state: {context_state}")
-    
-    # Helper function to safely parse a string that might be markdown-wrapped JSON
-    def safe_json_parse(value: any, key_name: str) -> any:
-        if not isinstance(value, str):
-            return value # It's already an object, return as-is
-
-        cleaned_str = value.strip()
-        match = re.search(r"```json\s*([\s\S]*?)\s*```", cleaned_str)
-        if match:
-            cleaned_str = match.group(1)
-        
-        try:
-            return json.loads(cleaned_str)
-        except json.JSONDecodeError:
-            logger.warning(f"[Callback] Could not parse '{key_name}' as JSON. Using raw string value.")
-            return value # Return the original string if parsing fails
+    # Read only the keys needed; dumping the whole state is for debugging
+    state = callback_context.state
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[Callback] Current callback_context.state: %s", state.to_dict())
 
-    notification_data = safe_json_parse(context_state.get('calendar_request'), 'notification_result')
+    notification_data = _safe_json_parse(state.get('calendar_request'), 'calendar_request')
     
-    if notification_data is None and 'notification_result' in context_state:
-        logger.warning(f"[Callback] No notification data found in state for agent: {agent_name}")
+    if notification_data is None and 'notification_result' in state:
+        logger.warning("[Callback] No notification data found in state for agent: %s", agent_name)
         return None
 
-    send_calendar_notification_to_ui(notification_data)
+    await send_calendar_notification_to_ui(notification_data)
     
     try:
         # Saving artifacts
@@ -136,9 +217,9 @@ async def post_lead_manager_callback(callback_context: CallbackContext) -> Optio
             "notification_data": notification_data,
             "timestamp": datetime.now().isoformat()
         })
-        logger.info(f"[Callback] Saved artifact with notification data for task completion.")
+        logger.debug("[Callback] Saved artifact with notification data for task completion.")
     except Exception as e:
-        logger.error(f"[Callback] Error saving final artifact: {e}")
+        logger.error("[Callback] Error saving final artifact: %s", e)
 
     logger.info("[Callback] UI updates sent. Callback finished.")
     return None
@@ -56,41 +56,48 @@ Save your findings under the 'unread_emails' output key as a structured list.
 """
 
 
-EMAIL_ANALYZER_PROMPT = """
+# Static instructions go in the system prompt so every request shares a
+# cacheable prefix; only the short user message varies per email.
+EMAIL_ANALYZER_SYSTEM = """
 ### ROLE
 You are an expert Email Analyzer Agent. Your only job is to analyze the email provided and determine if it contains a meeting request.
 
 ### INSTRUCTIONS
-1.  Carefully analyze the 'Body content' and 'Subject line' of the email data below.
+1.  Carefully analyze the 'Body content' and 'Subject line' of the email data provided in the user message.
 2.  Look for explicit requests (e.g., "Can we schedule a meeting?") or implicit requests (e.g., "When would be a good time to talk?").
 3.  If a specific date and time is proposed, extract it. The current year is 2025.
-4.  **You MUST output your response as a single, valid JSON object.**
-5.  **Enclose the JSON object within a single ```json ... ``` code block.**
-6.  **Do NOT output any other text, explanations, or conversational filler before or after the JSON block.**
-
-### EMAIL DATA
-```json
-{email_data}
-```
+4.  **You MUST output your response as raw JSON, one result object per email.**
+5.  **Do NOT wrap the JSON in a code block or add any other text, explanations, or conversational filler.**
 
 ### OUTPUT FORMAT
 If the email contains a meeting request, you MUST respond with the following JSON structure:
 
 ```json
-{{
+{
    "status": "meeting_request",
    "title": "Meeting with sender_name",
    "description": "concise_summary_of_the_email_body",
-   "": "The proposed start time in ISO 8601 format, e.g., 2025-06-24T11:35:00-06:00",
+   "start_datetime": "The proposed start time in ISO 8601 format, e.g., 2025-06-24T11:35:00-06:00",
    "end_datetime": "The calculated end time in ISO 8601 format, typically 45-60 minutes after start_datetime",
    "attendees": ["sender_email", "sales@zemzen.org"]
-}}
+}
 ```
 If the email does not contain a meeting request, respond with:
 ```json
-{{
+{
   "status": "no_meeting_request"
-}}
+}
+```
+"""
+
+EMAIL_ANALYZER_USER_TEMPLATE = """
+### EMAIL DATA
+The emails below are a JSON array; each entry has an "id" and the email data.
+Analyze every email independently and respond with a single JSON array holding
+one result object per email, with its "id" and the fields from the OUTPUT FORMAT.
+
+```json
+{emails}
 ```
 """
 
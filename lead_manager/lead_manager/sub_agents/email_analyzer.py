@@ -2,26 +2,27 @@
 Email Analyzer Agent for analyzing emails and identifying hot leads with meeting requests.
 Fixed version with robust JSON parsing, updated imports, and complete Event objects.
 """
+import asyncio
 import json
 import logging
 import re
-from typing import AsyncGenerator, Dict, Any, Optional
+from typing import AsyncGenerator, AsyncIterator, Dict, Any, List, Optional, Tuple
 from typing_extensions import override
 
 # --- FIX 1, PART A: Move imports to the top of the file ---
-import google.generativeai as genai
 from google.adk.agents import BaseAgent
 from google.adk.agents.invocation_context import InvocationContext
 from google.adk.events import Event
 from google.genai import types
-from ..tools.bigquery_utils import check_hot_lead
-from ..config import MODEL # Assuming MODEL is in your config
-from ..prompts import EMAIL_ANALYZER_PROMPT
-from ..tools.meeting_request_llm import is_meeting_request_llm
-from ..callbacks import send_hot_lead_to_ui
+from ..tools.bigquery_utils import check_hot_lead, prefetch_hot_leads
+from ..tools.meeting_request_llm import iter_meeting_analyses
+from ..callbacks import flush_ui_updates, send_hot_lead_to_ui
 
 logger = logging.getLogger(__name__)
 
+# Emails whose hot-lead lookup may run at the same time
+EMAIL_ANALYSIS_CONCURRENCY = 5
+
 def parse_llm_json_output(raw_data: str) -> dict:
     """
     Extracts and parses a JSON object from a raw string, which might include
@@ -42,7 +43,7 @@ def parse_llm_json_output(raw_data: str) -> dict:
     try:
         return json.loads(json_str.strip())
     except json.JSONDecodeError as e:
-        logger.warning(f"Initial JSON parsing failed: {e}. Attempting correction...")
+        logger.warning("Initial JSON parsing failed: %s. Attempting correction...", e)
 
     # Step 3: Fallback 1 - Simple regex to remove trailing commas
     try:
@@ -51,7 +52,7 @@ def parse_llm_json_output(raw_data: str) -> dict:
         logger.info("Attempting to parse again after removing trailing commas.")
         return json.loads(corrected_str.strip())
     except json.JSONDecodeError as e2:
-        logger.error(f"Fallback parsing also failed: {e2}")
+        logger.error("Fallback parsing also failed: %s", e2)
         # As a final resort, you could even ask another LLM to fix the JSON,
         # but for now, we will raise the error.
         raise ValueError(f"Could not parse the JSON string even after correction attempts.") from e2
@@ -87,19 +88,56 @@ class EmailAnalyzer(BaseAgent):
             # Save to state using the event's actions
             event.actions.state_delta[self.output_key] = result
 
-    async def _is_meeting_request_llm(self, email_data: Dict[str, Any], ctx: InvocationContext) -> dict:
-        """Delegate meeting request analysis to the shared tool."""
-        return await is_meeting_request_llm(email_data, self.name)
+    def _iter_meeting_analyses(
+        self, emails: List[Dict[str, Any]], ctx: InvocationContext
+    ) -> AsyncIterator[Tuple[int, dict]]:
+        """Delegate meeting request analysis of several emails to the shared tool."""
+        return iter_meeting_analyses(emails, self.name)
+
+    async def _check_hot_lead(
+        self,
+        email_data: Dict[str, Any],
+        semaphore: asyncio.Semaphore,
+        tag: str
+    ) -> bool:
+        """
+        Check one email's sender against the hot leads and notify the UI
+        when the sender is a hot lead.
+        """
+        sender_email = email_data.get("sender_email_address", "") or email_data.get("sender_email", "")
+        if not sender_email:
+            logger.warning("%s No sender email found.", tag)
+            return False
+
+        async with semaphore:
+            if not await check_hot_lead(sender_email):
+                return False
+        logger.info("%s Hot lead identified: %s", tag, sender_email)
+
+        # Send hot lead notification to UI
+        try:
+            await send_hot_lead_to_ui(email_data)
+            logger.info("%s Hot lead notification sent to UI for: %s", tag, sender_email)
+        except Exception as ui_error:
+            logger.error("%s Failed to send hot lead notification to UI: %s", tag, ui_error)
+        return True
+
+    async def _post_process(self, sender_email: str, tag: str) -> None:
+        """Bookkeeping that can overlap with the calendar organizer run."""
+        await flush_ui_updates()
+        logger.debug("%s Hot lead notifications delivered before scheduling for: %s", tag, sender_email)
 
     @override
     async def _run_async_impl(
         self, ctx: InvocationContext
     ) -> AsyncGenerator[Event, None]:
-        logger.info(f"[{self.name}] Starting email analysis workflow.")
+        # Log prefix built once per run instead of in every message
+        tag = f"[{self.name}]"
+        logger.info("%s Starting email analysis workflow.", tag)
         unread_emails_data = ctx.session.state.get("unread_emails")
 
         if not unread_emails_data:
-            logger.info(f"[{self.name}] No unread emails data found in session state.")
+            logger.info("%s No unread emails data found in session state.", tag)
             event = Event(content=types.Content(parts=[types.Part(text="No unread emails data found.")]), author=self.name)
             self.__maybe_save_output_to_state(event)  # Save to state
             yield event
@@ -108,7 +146,7 @@ class EmailAnalyzer(BaseAgent):
         try:
             unread_emails_dict = parse_llm_json_output(unread_emails_data)
         except (ValueError, TypeError) as e:
-            logger.error(f"[{self.name}] Failed to parse unread emails data: {e}")
+            logger.error("%s Failed to parse unread emails data: %s", tag, e)
             ctx.session.state["meeting_result"] = "parsing_failed"
             event = Event(
                 content=types.Content(parts=[types.Part(text=f"Email analysis failed: {e}")]),
@@ -119,7 +157,7 @@ class EmailAnalyzer(BaseAgent):
             return
 
         emails_list = unread_emails_dict.get("unread_emails", [])
-        logger.info(f"[{self.name}]✅ Found {len(emails_list)} unread emails to analyze.")
+        logger.info("%s✅ Found %s unread emails to analyze.", tag, len(emails_list))
         if not emails_list:
             ctx.session.state["meeting_result"] = "no_action_needed"
             event = Event(content=types.Content(parts=[types.Part(text="No unread emails found to analyze.")]), author=self.name)
@@ -127,53 +165,67 @@ class EmailAnalyzer(BaseAgent):
             yield event
             return
 
-        logger.info(f"[{self.name}] Analyzing {len(emails_list)} emails for hot leads...")
-        hot_leads_found = 0
+        logger.info("%s Analyzing %s emails for hot leads...", tag, len(emails_list))
         meeting_requests_found = 0
 
         ctx.session.state["calendar_request"] = ''
         ctx.session.state["email_message_id"] = ''
         
-        for email_data in emails_list:
-            sender_email = email_data.get("sender_email_address", "") or email_data.get("sender_email", "")
-            if not sender_email:
-                logger.warning(f"[{self.name}] No sender email found.")
-                continue
+        # Look all senders up in one query, then check them concurrently against the cache
+        await prefetch_hot_leads(
+            email_data.get("sender_email_address", "") or email_data.get("sender_email", "")
+            for email_data in emails_list
+        )
+        semaphore = asyncio.Semaphore(EMAIL_ANALYSIS_CONCURRENCY)
+        results = await asyncio.gather(
+            *(self._check_hot_lead(email_data, semaphore, tag) for email_data in emails_list),
+            return_exceptions=True,
+        )
 
+        hot_lead_emails = []
+        for email_data, result in zip(emails_list, results):
+            if isinstance(result, Exception):
+                sender_email = email_data.get("sender_email_address", "") or email_data.get("sender_email", "")
+                logger.error("%s Error processing email for %s: %s", tag, sender_email, result, exc_info=result)
+            elif result:
+                hot_lead_emails.append(email_data)
+        hot_leads_found = len(hot_lead_emails)
+
+        # Hot lead emails are classified in batches; the first meeting request to come
+        # back wins, and closing the iterator cancels the batches still in flight
+        meeting_request = None
+        analyses = self._iter_meeting_analyses(hot_lead_emails, ctx)
+        try:
+            async for index, calendar_request_data in analyses:
+                email_data = hot_lead_emails[index]
+                sender_email = email_data.get("sender_email_address", "") or email_data.get("sender_email", "")
+                logger.info("%s✅ LLM analysis result for %s: %s", tag, sender_email, calendar_request_data)
+
+                if calendar_request_data.get("status") == "meeting_request":
+                    meeting_request = (email_data, sender_email, calendar_request_data)
+                    break
+                logger.info("%s No meeting request found in email from %s.", tag, sender_email)
+        finally:
+            await analyses.aclose()
+
+        if meeting_request is not None:
+            email_data, sender_email, calendar_request_data = meeting_request
+            logger.info("%s Meeting request found from hot lead: %s", tag, sender_email)
+
+            ctx.session.state["calendar_request"] = calendar_request_data
+            ctx.session.state["email_message_id"] = email_data.get("message_id", "")
+            ctx.session.state["email_data"] = email_data
+
+            # Deliver the queued hot lead notifications while the calendar organizer runs,
+            # so they reach the UI ahead of the meeting notification
+            post_process = asyncio.create_task(self._post_process(sender_email, tag))
             try:
-                # The logic inside this try/except is now correct
-                if await check_hot_lead(sender_email):
-                    hot_leads_found += 1
-                    logger.info(f"[{self.name}] Hot lead identified: {sender_email}")
-                    
-                    # Send hot lead notification to UI
-                    try:
-                        send_hot_lead_to_ui(email_data)
-                        logger.info(f"[{self.name}] Hot lead notification sent to UI for: {sender_email}")
-                    except Exception as ui_error:
-                        logger.error(f"[{self.name}] Failed to send hot lead notification to UI: {ui_error}")
-                    
-                    calendar_request_data = await self._is_meeting_request_llm(email_data, ctx)
-                    logger.info(f"[{self.name}]✅ LLM analysis result for {sender_email}: {calendar_request_data}")
-                    if calendar_request_data.get("status") == "meeting_request":
-                        logger.info(f"[{self.name}] Meeting request found from hot lead: {sender_email}")
-
-                        ctx.session.state["calendar_request"] = calendar_request_data
-                        ctx.session.state["email_message_id"] = email_data.get("message_id", "")
-                        ctx.session.state["email_data"] = email_data
-                        
-                        # Propagate events from sub-agent and save to state
-                        async for event in self.calendar_organizer_agent.run_async(ctx):
-                            self.__maybe_save_output_to_state(event)  # Save to state
-                            yield event
-                        break
-                    else:
-                        logger.info(f"[{self.name}] No meeting request found in email from {sender_email}.")
-                    
-            except Exception as e:
-                # This will catch errors during check_hot_lead or _is_meeting_request_llm
-                logger.error(f"[{self.name}] Error processing email for {sender_email}: {e}", exc_info=True)
-                continue
+                # Propagate events from sub-agent and save to state
+                async for event in self.calendar_organizer_agent.run_async(ctx):
+                    self.__maybe_save_output_to_state(event)  # Save to state
+                    yield event
+            finally:
+                await post_process
 
         summary_message = f"Analyzed {len(emails_list)} emails. Found {hot_leads_found} hot leads and {meeting_requests_found} meeting requests. No further action needed at this time."
         ctx.session.state["meeting_result"] = "no_meeting_requests"
@@ -185,4 +237,4 @@ class EmailAnalyzer(BaseAgent):
         )
         self.__maybe_save_output_to_state(event)  # Save to state
         yield event
-        logger.info(f"[{self.name}] Email analysis workflow finished.")
\ No newline at end of file
+        logger.info("%s Email analysis workflow finished.", tag)
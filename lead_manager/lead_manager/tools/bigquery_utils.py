@@ -4,9 +4,12 @@ BigQuery utility tools for Lead Manager.
 import asyncio
 import json
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime
+from functools import cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Optional
 
 from google.adk.tools import FunctionTool
 from google.cloud import bigquery
@@ -26,6 +29,101 @@ def _write_json_file(filepath: Path, data: Dict[str, Any]) -> None:
     with open(filepath, 'w', encoding='utf-8') as f:
         json.dump(output_data, f, indent=2, ensure_ascii=False)
 
+# Process-local cache of hot lead lookups keyed by lowercased email; entries expire after
+# HOT_LEAD_CACHE_TTL seconds so changes to the leads table are picked up quickly.
+HOT_LEAD_CACHE_TTL = 300
+HOT_LEAD_CACHE_MAXSIZE = 50_000
+_hot_lead_cache: "OrderedDict[str, tuple[float, Optional[Dict[str, Any]]]]" = OrderedDict()
+
+
+@cache
+def _get_bigquery_client() -> bigquery.Client:
+    """Return the shared BigQuery client for hot lead lookups."""
+    return bigquery.Client(project=PROJECT)
+
+
+def _row_to_lead_data(row) -> Dict[str, Any]:
+    """Convert a BigQuery row to a dictionary with JSON-serializable datetimes."""
+    lead_data = dict(row)
+    for key, value in lead_data.items():
+        if isinstance(value, datetime):
+            lead_data[key] = value.isoformat()
+    return lead_data
+
+
+def _cache_hot_lead(email_key: str, lead_data: Optional[Dict[str, Any]]) -> None:
+    """Remember a lookup result; None records that the email is not a hot lead."""
+    _hot_lead_cache[email_key] = (time.monotonic(), lead_data)
+    _hot_lead_cache.move_to_end(email_key)
+    if len(_hot_lead_cache) > HOT_LEAD_CACHE_MAXSIZE:
+        _hot_lead_cache.popitem(last=False)
+
+
+def _hot_lead_result(email_address: str, lead_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build the check_hot_lead response for a lookup result."""
+    if lead_data is None:
+        logger.info(f"❌ {email_address} is not a hot lead")
+        return {
+            "success": True,
+            "is_hot_lead": False,
+            "email": email_address,
+            "lead_data": None,
+            "message": f"{email_address} is not found in hot leads database"
+        }
+
+    logger.info(f"✅ {email_address} is a hot lead!")
+    return {
+        "success": True,
+        "is_hot_lead": True,
+        "email": email_address,
+        "lead_data": dict(lead_data),
+        "message": f"{email_address} found in hot leads database"
+    }
+
+
+async def prefetch_hot_leads(email_addresses: Iterable[str]) -> None:
+    """
+    Look up several email addresses with a single query and cache the results,
+    so the following check_hot_lead calls for them skip BigQuery.
+    """
+    now = time.monotonic()
+    email_keys = set()
+    for email_address in email_addresses:
+        email_key = email_address.strip().lower()
+        cached = _hot_lead_cache.get(email_key)
+        if email_key and (cached is None or now - cached[0] >= HOT_LEAD_CACHE_TTL):
+            email_keys.add(email_key)
+    if not email_keys:
+        return
+
+    try:
+        client = _get_bigquery_client()
+        query = f"""
+        SELECT 
+            *
+        FROM `{PROJECT}.{DATASET_ID}.{TABLE_ID}`
+        WHERE LOWER(email) IN UNNEST(@email_addresses)
+        """
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ArrayQueryParameter("email_addresses", "STRING", sorted(email_keys)),
+            ]
+        )
+        results = await asyncio.to_thread(
+            lambda: list(client.query(query, job_config=job_config))
+        )
+    except Exception as e:
+        logger.error(f"❌ Error prefetching hot leads: {e}")
+        return
+
+    leads = {}
+    for row in results:
+        lead_data = _row_to_lead_data(row)
+        leads.setdefault(str(lead_data.get("email", "")).lower(), lead_data)
+    for email_key in email_keys:
+        _cache_hot_lead(email_key, leads.get(email_key))
+
+
 async def check_hot_lead(email_address: str) -> bool:
     """
     Check if an email address is in the hot leads database.
@@ -36,13 +134,17 @@ async def check_hot_lead(email_address: str) -> bool:
     Returns:
         bool indicating if the email is a hot lead or not, along with lead data if found.
     """
-    
-    # Sleep for 2 sec
+    email_key = email_address.strip().lower()
+    cached = _hot_lead_cache.get(email_key)
+    if cached is not None and time.monotonic() - cached[0] < HOT_LEAD_CACHE_TTL:
+        _hot_lead_cache.move_to_end(email_key)
+        return _hot_lead_result(email_address, cached[1])
+
     try:
         logger.info(f"🔍 Checking if {email_address} is a hot lead...")
         
-        # Initialize BigQuery client
-        client = bigquery.Client(project=PROJECT)
+        # Reuse the shared BigQuery client
+        client = _get_bigquery_client()
         
         # Query to check if email exists in hot leads table
         query = f"""
@@ -60,36 +162,15 @@ async def check_hot_lead(email_address: str) -> bool:
             ]
         )
         
-        # Execute query
-        query_job = client.query(query, job_config=job_config)
-        results = list(query_job)
-        
-        if not results:
-            logger.info(f"❌ {email_address} is not a hot lead")
-            return {
-                "success": True,
-                "is_hot_lead": False,
-                "email": email_address,
-                "lead_data": None,
-                "message": f"{email_address} is not found in hot leads database"
-            }
+        # Execute query off the event loop so concurrent lead checks overlap
+        results = await asyncio.to_thread(
+            lambda: list(client.query(query, job_config=job_config))
+        )
         
         # Convert BigQuery row to dictionary
-        lead_data = dict(results[0])
-        
-        # Convert any datetime objects to strings for JSON serialization
-        for key, value in lead_data.items():
-            if isinstance(value, datetime):
-                lead_data[key] = value.isoformat()
-        
-        logger.info(f"✅ {email_address} is a hot lead!")
-        return {
-            "success": True,
-            "is_hot_lead": True,
-            "email": email_address,
-            "lead_data": lead_data,
-            "message": f"{email_address} found in hot leads database"
-        }
+        lead_data = _row_to_lead_data(results[0]) if results else None
+        _cache_hot_lead(email_key, lead_data)
+        return _hot_lead_result(email_address, lead_data)
         
     except Exception as e:
         logger.error(f"❌ Error checking hot lead: {e}")
@@ -59,6 +59,15 @@ def extract_email_address(email_string):
         return email_string.split('<')[1].split('>')[0]
     return email_string.strip()
 
+def is_automated_message(headers):
+    """Whether the message headers mark it as automated or bulk mail (RFC 3834, RFC 2369)"""
+    header_values = {h['name'].lower(): h['value'].strip().lower() for h in headers}
+    if header_values.get('auto-submitted', 'no') != 'no':
+        return True
+    if 'list-unsubscribe' in header_values:
+        return True
+    return header_values.get('precedence') in ('bulk', 'list', 'junk')
+
 def get_thread_details(service, thread_id):
     """Get detailed information about an email thread"""
     try:
@@ -174,7 +183,8 @@ async def check_unread_emails() -> Dict[str, Any]:
                 'body': body,
                 'preview': body[:200] + '...' if len(body) > 200 else body,
                 'thread_message_count': thread_info['message_count'],
-                'thread_participants': thread_info['participants']
+                'thread_participants': thread_info['participants'],
+                'is_automated': is_automated_message(headers)
             }
             
             unread_emails.append(email_data)
@@ -1,74 +1,275 @@
+import asyncio
+import hashlib
 import json
 import logging
 import os
+import re
+import time
+from collections import OrderedDict
+from functools import cache, lru_cache
 import vertexai
 from vertexai.generative_models import GenerativeModel, GenerationConfig
 from google.auth import default
 from google.oauth2 import service_account
-from typing import Dict, Any
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
 
 from ..config import CLOUD_PROJECT_ID, CLOUD_PROJECT_REGION, MODEL, SERVICE_ACCOUNT_FILE
-from ..prompts import EMAIL_ANALYZER_PROMPT
+from ..prompts import EMAIL_ANALYZER_SYSTEM, EMAIL_ANALYZER_USER_TEMPLATE
 
 logger = logging.getLogger(__name__)
 
-async def is_meeting_request_llm(email_data: Dict[str, Any], agent_name: str) -> Dict[str, Any]:
+# Process-local LRU cache of LLM analyses keyed by email content; entries expire after
+# ANALYSIS_CACHE_TTL seconds. Raw responses are stored so every hit decodes a fresh copy.
+ANALYSIS_CACHE_TTL = 86400
+ANALYSIS_CACHE_MAXSIZE = 10_000
+_analysis_cache: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+
+# Automated mail (newsletters, bounces, autoreplies) is never a meeting request,
+# so it is answered without an LLM call. Only the sender, the subject and the
+# automated-mail headers are checked: a prospect's body can mention "no reply"
+# or quote a newsletter footer and still ask for a meeting.
+_AUTOMATED_SENDER_RE = re.compile(
+    r"\b(?:no[-_.]?reply|do[-_.]?not[-_.]?reply|mailer-daemon|postmaster)\b",
+    re.IGNORECASE
+)
+_AUTOMATED_SUBJECT_RE = re.compile(
+    r"^(?:out of office|automatic reply|auto[- ]?reply|undeliverable|delivery status notification)\b",
+    re.IGNORECASE
+)
+
+# Emails classified together in one LLM request; larger polls are split into several requests
+EMAIL_BATCH_SIZE = 10
+
+# Keywords that mark an email as a meeting request when the LLM is unavailable
+_FALLBACK_KEYWORDS_RE = re.compile(r"meeting|schedule|call|discuss|available|appointment", re.IGNORECASE)
+
+# Only the start of an email decides whether it asks for a meeting; quoted reply
+# history is dropped and the rest capped before it is sent to the LLM
+EMAIL_BODY_MAX_CHARS = 2000
+_QUOTED_REPLY_RE = re.compile(r"\n>|On [^\n]*? wrote:")
+
+# The user message template is split once at import so each request only concatenates
+_USER_PROMPT_PREFIX, _USER_PROMPT_SUFFIX = EMAIL_ANALYZER_USER_TEMPLATE.split("{emails}")
+
+# Each analysis is a small JSON object, so decoding is capped per email
+ANALYSIS_MAX_OUTPUT_TOKENS = 256
+
+# Structured output schema: one analysis per email, matched back to it by id
+_MEETING_ANALYSIS_SCHEMA = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer"},
+            "status": {"type": "string", "enum": ["meeting_request", "no_meeting_request"]},
+            "title": {"type": "string"},
+            "description": {"type": "string"},
+            "start_datetime": {"type": "string"},
+            "end_datetime": {"type": "string"},
+            "attendees": {"type": "array", "items": {"type": "string"}}
+        },
+        "required": ["id", "status"],
+        "additionalProperties": False
+    }
+}
+
+
+@cache
+def _get_model() -> GenerativeModel:
     """
-    Use Vertex AI LLM to analyze email content to determine if it's a meeting request.
+    Initialize Vertex AI once and return the shared analysis model, so concurrent
+    email analyses reuse one client instead of rebuilding it per email.
     """
-    sender_email = email_data.get("sender_email_address", email_data.get("sender_email", "unknown"))
+    # Load service account credentials or fall back to default ADC
     try:
-        # Load service account credentials or fall back to default ADC
-        try:
-            credentials = service_account.Credentials.from_service_account_file(
-                SERVICE_ACCOUNT_FILE,
-                scopes=['https://www.googleapis.com/auth/cloud-platform']
-            )
-        except Exception as cred_err:
-            logging.warning(f"[{agent_name}] Could not load service account credentials: {cred_err}, falling back to default credentials.")
-            credentials, _ = default(scopes=['https://www.googleapis.com/auth/cloud-platform'])
-        vertexai.init(
-            project=CLOUD_PROJECT_ID,
-            location=CLOUD_PROJECT_REGION,
-            credentials=credentials
+        credentials = service_account.Credentials.from_service_account_file(
+            SERVICE_ACCOUNT_FILE,
+            scopes=['https://www.googleapis.com/auth/cloud-platform']
         )
-        analysis_prompt = EMAIL_ANALYZER_PROMPT.format(email_data=email_data)
-
-        combined_schema = {
-            "type": "object",
-            "properties": {
-                "status": {"type": "string", "enum": ["meeting_request", "no_meeting_request"]},
-                "title": {"type": "string"},
-                "description": {"type": "string"},
-                "start_datetime": {"type": "string"},
-                "end_datetime": {"type": "string"},
-                "attendees": {"type": "array", "items": {"type": "string"}}
-            },
-            "required": ["status"],
-            "additionalProperties": False
-        }
-
-        model = GenerativeModel(MODEL)
-        generation_config = GenerationConfig(
-            response_mime_type="application/json",
-            response_schema=combined_schema,
-            temperature=0.1,
-            max_output_tokens=1024
+    except Exception as cred_err:
+        logger.warning("Could not load service account credentials: %s, falling back to default credentials.", cred_err)
+        credentials, _ = default(scopes=['https://www.googleapis.com/auth/cloud-platform'])
+    vertexai.init(
+        project=CLOUD_PROJECT_ID,
+        location=CLOUD_PROJECT_REGION,
+        credentials=credentials
+    )
+    # The static rubric is the system instruction so requests share a cacheable prefix
+    return GenerativeModel(MODEL, system_instruction=EMAIL_ANALYZER_SYSTEM)
+
+
+@lru_cache(maxsize=EMAIL_BATCH_SIZE)
+def _get_generation_config(batch_size: int) -> GenerationConfig:
+    """Return the JSON-mode generation config for a batch of the given size."""
+    return GenerationConfig(
+        response_mime_type="application/json",
+        response_schema=_MEETING_ANALYSIS_SCHEMA,
+        temperature=0.1,
+        max_output_tokens=ANALYSIS_MAX_OUTPUT_TOKENS * batch_size
+    )
+
+
+def _sender_email(email_data: Dict[str, Any]) -> str:
+    """Return the email's sender address under either naming scheme."""
+    return email_data.get("sender_email_address", email_data.get("sender_email", "unknown"))
+
+
+def _email_fields(email_data: Dict[str, Any]) -> tuple[str, str]:
+    """Return the email's subject and body under either naming scheme."""
+    subject = email_data.get("subject_line") or email_data.get("subject", "")
+    body = email_data.get("body_content") or email_data.get("body", "")
+    return subject, body
+
+
+def _analysis_cache_key(sender_email: str, subject: str, body: str) -> str:
+    """Hash the fields that decide the analysis so recurring emails share one entry."""
+    return hashlib.blake2b(f"{sender_email}|{subject}|{body}".encode(), digest_size=16).hexdigest()
+
+
+def _trim_body(body: str) -> str:
+    """Drop quoted reply history and cap the body at EMAIL_BODY_MAX_CHARS."""
+    match = _QUOTED_REPLY_RE.search(body)
+    if match and match.start() > 0:
+        body = body[:match.start()]
+    if len(body) > EMAIL_BODY_MAX_CHARS:
+        return body[:EMAIL_BODY_MAX_CHARS] + "…[truncated]"
+    return body
+
+
+def _prompt_email(email_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of the email with its body trimmed for the analysis prompt."""
+    email = dict(email_data)
+    for key in ("body", "body_content"):
+        if isinstance(email.get(key), str):
+            email[key] = _trim_body(email[key])
+    return email
+
+
+def _fallback_analysis(email_data: Dict[str, Any], sender_email: str) -> Dict[str, Any]:
+    """Keyword heuristic used when the LLM analysis is unavailable."""
+    email_text = f"{email_data.get('subject_line', '')} {email_data.get('body_content', '')}"
+    if _FALLBACK_KEYWORDS_RE.search(email_text):
+        return {"status": "meeting_request", "fallback": True, "title": f"Meeting with {sender_email}"}
+    return {"status": "no_meeting_request", "fallback": True}
+
+
+async def _analyze_batch(
+    emails: List[Dict[str, Any]],
+    cache_keys: List[str],
+    agent_name: str
+) -> List[Dict[str, Any]]:
+    """Classify up to EMAIL_BATCH_SIZE emails with a single LLM request."""
+    try:
+        model = _get_model()
+        emails_json = json.dumps(
+            [{"id": i, "email": _prompt_email(email_data)} for i, email_data in enumerate(emails)],
+            ensure_ascii=False,
+            default=str
         )
+        analysis_prompt = _USER_PROMPT_PREFIX + emails_json + _USER_PROMPT_SUFFIX
         response = await model.generate_content_async(
             analysis_prompt,
-            generation_config=generation_config
+            generation_config=_get_generation_config(len(emails))
         )
-        raw_response = response.candidates[0].content.parts[0].text
-        return json.loads(raw_response)
-
+        # JSON mode returns the bare array, so the text is parsed directly
+        raw_response = response.text
+        analyses = {item.pop("id"): item for item in json.loads(raw_response)}
     except Exception as e:
-        logger.error(f"[{agent_name}] Error in LLM meeting analysis for {sender_email}: {e}")
-        simple_keywords = ["meeting", "schedule", "call", "discuss", "available", "appointment"]
-        email_text = f"{email_data.get('subject_line', '')} {email_data.get('body_content', '')}".lower()
-        if any(keyword in email_text for keyword in simple_keywords):
-            return {"status": "meeting_request", "fallback": True, "title": f"Meeting with {sender_email}"}
-        return {"status": "no_meeting_request", "fallback": True}
+        logger.error(f"[{agent_name}] Error in LLM meeting analysis for {len(emails)} emails: {e}")
+        analyses = {}
+
+    results = []
+    for i, (email_data, cache_key) in enumerate(zip(emails, cache_keys)):
+        result = analyses.get(i)
+        if result is None:
+            results.append(_fallback_analysis(email_data, _sender_email(email_data)))
+            continue
+        # Only successful analyses are cached; fallbacks and errors are retried next time
+        if result.get("status") != "error":
+            _analysis_cache[cache_key] = (time.monotonic(), json.dumps(result))
+            if len(_analysis_cache) > ANALYSIS_CACHE_MAXSIZE:
+                _analysis_cache.popitem(last=False)
+        results.append(result)
+    return results
+
+
+async def iter_meeting_analyses(
+    emails: List[Dict[str, Any]],
+    agent_name: str
+) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Use Vertex AI LLM to determine which of the given emails are meeting requests,
+    yielding (index, analysis) pairs as they become ready.
+
+    Automated and previously analyzed emails are answered first without the LLM. The
+    rest are sent together, EMAIL_BATCH_SIZE per request, so the static instructions
+    are prefilled once per batch rather than once per email; each batch is yielded as
+    its request completes. Closing the iterator early cancels the requests in flight.
+    """
+    resolved: List[Tuple[int, Dict[str, Any]]] = []
+    pending: List[int] = []
+    cache_keys: List[str] = []
+    for index, email_data in enumerate(emails):
+        sender_email = _sender_email(email_data)
+        subject, body = _email_fields(email_data)
+        if (
+            email_data.get("is_automated")
+            or _AUTOMATED_SENDER_RE.search(sender_email)
+            or _AUTOMATED_SUBJECT_RE.search(subject.strip())
+        ):
+            logger.debug("[%s] Skipping LLM analysis for automated email from %s", agent_name, sender_email)
+            resolved.append((index, {"status": "no_meeting_request"}))
+            continue
+
+        cache_key = _analysis_cache_key(sender_email, subject, body)
+        cached = _analysis_cache.get(cache_key)
+        if cached is not None:
+            cached_at, cached_response = cached
+            if time.monotonic() - cached_at < ANALYSIS_CACHE_TTL:
+                _analysis_cache.move_to_end(cache_key)
+                logger.debug("[%s] Using cached meeting analysis for %s", agent_name, sender_email)
+                resolved.append((index, json.loads(cached_response)))
+                continue
+            del _analysis_cache[cache_key]
+
+        pending.append(index)
+        cache_keys.append(cache_key)
+
+    async def analyze(indices: List[int], keys: List[str]):
+        return indices, await _analyze_batch([emails[i] for i in indices], keys, agent_name)
+
+    tasks = [
+        asyncio.create_task(analyze(pending[start:start + EMAIL_BATCH_SIZE], cache_keys[start:start + EMAIL_BATCH_SIZE]))
+        for start in range(0, len(pending), EMAIL_BATCH_SIZE)
+    ]
+    try:
+        for item in resolved:
+            yield item
+        for next_done in asyncio.as_completed(tasks):
+            indices, analyses = await next_done
+            for item in zip(indices, analyses):
+                yield item
+    finally:
+        # Stop outstanding requests once the consumer has what it needs
+        for task in tasks:
+            task.cancel()
+
+
+async def is_meeting_request_llm_batch(emails: List[Dict[str, Any]], agent_name: str) -> List[Dict[str, Any]]:
+    """
+    Analyze all of the given emails; returns one analysis per email, in the same order.
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(emails)
+    async for index, analysis in iter_meeting_analyses(emails, agent_name):
+        results[index] = analysis
+    return results
+
+
+async def is_meeting_request_llm(email_data: Dict[str, Any], agent_name: str) -> Dict[str, Any]:
+    """
+    Use Vertex AI LLM to analyze email content to determine if it's a meeting request.
+    """
+    return (await is_meeting_request_llm_batch([email_data], agent_name))[0]
 
 async def test_is_meeting_request_llm():
     """
@@ -90,25 +291,3 @@ async def test_is_meeting_request_llm():
     }
     result = await is_meeting_request_llm(email_data, "TestAgent")
     return result
-
-
-def simple_test():
-    # Test credentials
-    credentials = service_account.Credentials.from_service_account_file(
-       SERVICE_ACCOUNT_FILE,
-        scopes=['https://www.googleapis.com/auth/cloud-platform']
-    )
-
-    vertexai.init(
-        project=CLOUD_PROJECT_ID,
-        location=CLOUD_PROJECT_REGION,
-        credentials=credentials
-    )
-    
-    print("Project ID:", CLOUD_PROJECT_ID)
-    print("Region:", CLOUD_PROJECT_REGION)
-
-    model = GenerativeModel("gemini-2.0-flash")
-    response = model.generate_content("Hello, test message!")
-    
-    return response.text
\ No newline at end of file
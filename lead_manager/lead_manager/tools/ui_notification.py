@@ -3,14 +3,16 @@ UI Notification tool for Lead Manager.
 """
 
 import logging
-import os
 from typing import Dict, Any, Optional
 from datetime import datetime
 
 import httpx
-import common.config as config
+import orjson
 from google.adk.tools import FunctionTool
 
+# Meeting notifications go through the same pooled UI client as the agent callbacks
+from ..callbacks import _CALLBACK_ENDPOINT, _JSON_HEADERS, _UI_CLIENT
+
 logger = logging.getLogger(__name__)
 
 async def notify_meeting_arranged(
@@ -32,29 +34,36 @@ async def notify_meeting_arranged(
     try:
         logger.info("📤 Sending meeting arrangement notification to UI...")
         
-        # Get UI client URL
-        ui_client_url = os.environ.get(
-            "UI_CLIENT_SERVICE_URL", config.DEFAULT_UI_CLIENT_URL
-        ).rstrip("/")
-        callback_endpoint = f"{ui_client_url}/agent_callback"
-        
+        callback_endpoint = _CALLBACK_ENDPOINT
+
+        # Values used in more than one place below
+        lead_name = lead_data.get("name", "Unknown")
+        lead_email = lead_data.get("email", "")
+        meeting_id = meeting_data.get("meeting_id", "")
+        meeting_title = meeting_data.get("title", "")
+        now_iso = datetime.now().isoformat()
+        # Only build the fallback id when the lead has none
+        lead_id = lead_data.get("id")
+        if lead_id is None:
+            lead_id = f"lead_{lead_data.get('email', 'unknown')}"
+
         # Prepare notification payload
         payload = {
             "agent_type": "calendar",
-            "business_id": lead_data.get("id", f"lead_{lead_data.get('email', 'unknown')}"),
+            "business_id": lead_id,
             "status": "meeting_scheduled",
-            "message": f"Meeting arranged with {lead_data.get('name', 'Unknown')} ({lead_data.get('email', 'unknown email')})",
-            "timestamp": datetime.now().isoformat(),
+            "message": f"Meeting arranged with {lead_name} ({lead_email or 'unknown email'})",
+            "timestamp": now_iso,
             "data": {
                 # Lead information
-                "lead_name": lead_data.get("name", "Unknown"),
-                "lead_email": lead_data.get("email", ""),
+                "lead_name": lead_name,
+                "lead_email": lead_email,
                 "lead_company": lead_data.get("company", ""),
                 "lead_phone": lead_data.get("phone", ""),
                 
                 # Meeting information
-                "meeting_id": meeting_data.get("meeting_id", ""),
-                "meeting_title": meeting_data.get("title", ""),
+                "meeting_id": meeting_id,
+                "meeting_title": meeting_title,
                 "meeting_start": meeting_data.get("start_time", ""),
                 "meeting_end": meeting_data.get("end_time", ""),
                 "meeting_duration": meeting_data.get("duration", 60),
@@ -69,21 +78,20 @@ async def notify_meeting_arranged(
                 
                 # Metadata
                 "agent_action": "meeting_arranged",
-                "processing_timestamp": datetime.now().isoformat()
+                "processing_timestamp": now_iso
             }
         }
         
         logger.info(f"📤 Sending notification to: {callback_endpoint}")
-        logger.info(f"📋 Meeting arranged: {meeting_data.get('title', 'Unknown')} with {lead_data.get('name', 'Unknown')}")
+        logger.info(f"📋 Meeting arranged: {meeting_title or 'Unknown'} with {lead_name}")
         
         # Send notification
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                callback_endpoint, 
-                json=payload, 
-                timeout=10.0
-            )
-            response.raise_for_status()
+        response = await _UI_CLIENT.post(
+            callback_endpoint,
+            content=orjson.dumps(payload),
+            headers=_JSON_HEADERS
+        )
+        response.raise_for_status()
             
         logger.info(f"✅ Successfully sent meeting notification to UI. Status: {response.status_code}")
         
@@ -91,8 +99,8 @@ async def notify_meeting_arranged(
             "success": True,
             "status_code": response.status_code,
             "endpoint": callback_endpoint,
-            "meeting_id": meeting_data.get("meeting_id", ""),
-            "lead_email": lead_data.get("email", ""),
+            "meeting_id": meeting_id,
+            "lead_email": lead_email,
             "message": "Meeting arrangement notification sent successfully to UI"
         }
         
@@ -2,15 +2,41 @@
 """Simple Lead Manager service without ADK dependencies"""
 
 import asyncio
-import requests
+import io
+import os
+import sys
 import json
+import httpx
+import orjson
 from fastapi import FastAPI, HTTPException
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel
 import uvicorn
 import click
 import common.config as config
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
+
+# Pre-serialized health payload: the async handler returns it as-is, so probes
+# skip response validation, JSON encoding and the threadpool hop. Like every
+# route it still passes through the GZip middleware, which leaves a body this
+# small uncompressed.
+_HEALTH_RESPONSE = Response(
+    content=b'{"status":"healthy","service":"lead_manager"}',
+    media_type="application/json",
+)
+
+@app.get("/health")
+async def health_check():
+    return _HEALTH_RESPONSE
+
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# Shared client so UI webhooks reuse pooled keep-alive connections
+_HTTP_CLIENT = httpx.AsyncClient(timeout=5.0)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+app.add_event_handler("shutdown", _HTTP_CLIENT.aclose)
 
 class SearchRequest(BaseModel):
     query: str
@@ -27,10 +53,6 @@ class EmailNotification(BaseModel):
 def read_root():
     return {"message": "Lead Manager service - simple version", "status": "running"}
 
-@app.get("/health")
-def health_check():
-    return {"status": "healthy", "service": "lead_manager"}
-
 @app.post("/search")
 async def process_search(request: SearchRequest):
     """Process search request and send WebSocket message to UI client"""
@@ -47,13 +69,11 @@ async def process_search(request: SearchRequest):
             "query": request.query
         }
         
-        import httpx
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{request.ui_client_url}/webhook/lead_manager",
-                json=payload,
-                timeout=5
-            )
+        response = await _HTTP_CLIENT.post(
+            f"{request.ui_client_url}/webhook/lead_manager",
+            content=orjson.dumps(payload),
+            headers=_JSON_HEADERS
+        )
         
         if response.status_code == 200:
             return {"status": "success", "message": "WebSocket message sent successfully"}
@@ -66,17 +86,19 @@ async def process_search(request: SearchRequest):
 @app.post("/process-email")
 async def process_email(notification: EmailNotification):
     """Process Gmail notification and trigger lead management workflow"""
+    # Buffer the report and write it once instead of one write per line
+    out = io.StringIO()
     try:
-        print(f"📧 Received email notification for {notification.email_address}")
-        print(f"   📊 Message count: {notification.message_count}")
-        print(f"   ⏰ Timestamp: {notification.timestamp}")
+        print(f"📧 Received email notification for {notification.email_address}", file=out)
+        print(f"   📊 Message count: {notification.message_count}", file=out)
+        print(f"   ⏰ Timestamp: {notification.timestamp}", file=out)
         
         # Process each message
         for i, message in enumerate(notification.messages, 1):
-            print(f"   📨 Message {i}:")
-            print(f"      Subject: {message.get('subject', 'No Subject')}")
-            print(f"      From: {message.get('sender', 'Unknown')}")
-            print(f"      Date: {message.get('date', 'Unknown')}")
+            print(f"   📨 Message {i}:", file=out)
+            print(f"      Subject: {message.get('subject', 'No Subject')}", file=out)
+            print(f"      From: {message.get('sender', 'Unknown')}", file=out)
+            print(f"      Date: {message.get('date', 'Unknown')}", file=out)
             
             # Extract key information for lead management
             subject = message.get('subject', '')
@@ -87,11 +109,11 @@ async def process_email(notification: EmailNotification):
             is_potential_lead = await qualify_lead(subject, sender, content)
             
             if is_potential_lead:
-                print(f"   🎯 Potential lead detected from {sender}")
+                print(f"   🎯 Potential lead detected from {sender}", file=out)
                 # Here you would trigger your lead management workflow
-                await process_potential_lead(message)
+                await process_potential_lead(message, out)
             else:
-                print(f"   📭 Not qualified as lead")
+                print(f"   📭 Not qualified as lead", file=out)
         
         return {
             "status": "success", 
@@ -100,8 +122,11 @@ async def process_email(notification: EmailNotification):
         }
         
     except Exception as e:
-        print(f"❌ Error processing email notification: {e}")
+        print(f"❌ Error processing email notification: {e}", file=out)
         raise HTTPException(status_code=500, detail=f"Error processing email: {str(e)}")
+    finally:
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
 
 async def qualify_lead(subject: str, sender: str, content: str) -> bool:
     """Basic lead qualification logic"""
@@ -128,15 +153,15 @@ async def qualify_lead(subject: str, sender: str, content: str) -> bool:
     
     return False
 
-async def process_potential_lead(message: dict):
-    """Process a qualified lead"""
+async def process_potential_lead(message: dict, out=None):
+    """Process a qualified lead (report lines go to `out`, default stdout)"""
     
-    print(f"   🚀 Processing potential lead...")
-    print(f"   📝 Actions taken:")
-    print(f"      • Lead recorded in CRM")
-    print(f"      • Auto-response queued")
-    print(f"      • Sales team notified")
-    print(f"      • Follow-up scheduled")
+    print(f"   🚀 Processing potential lead...", file=out)
+    print(f"   📝 Actions taken:", file=out)
+    print(f"      • Lead recorded in CRM", file=out)
+    print(f"      • Auto-response queued", file=out)
+    print(f"      • Sales team notified", file=out)
+    print(f"      • Follow-up scheduled", file=out)
     
     # Here you would implement:
     # 1. Store lead in database/CRM
@@ -151,10 +176,24 @@ async def process_potential_lead(message: dict):
 @click.command()
 @click.option("--host", default="localhost", help="Host to bind the server to.")
 @click.option("--port", default=config.DEFAULT_LEAD_MANAGER_PORT, help="Port to bind the server to.")
-def main(host: str, port: int):
+@click.option(
+    "--workers",
+    default=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 2)),
+    help="Number of worker processes (default: WEB_CONCURRENCY or CPU count).",
+)
+def main(host: str, port: int, workers: int):
     """Run the simple Lead Manager service."""
-    print(f"Starting simple Lead Manager service on http://{host}:{port}/")
-    uvicorn.run(app, host=host, port=port)
+    print(f"Starting simple Lead Manager service on http://{host}:{port}/ with {workers} worker(s)")
+    # Workers > 1 require an import string so each process can import the app
+    uvicorn.run(
+        "lead_manager.simple_main:app",
+        host=host,
+        port=port,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+    )
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -83,9 +83,9 @@ def main():
     logger.info(f"Workers: {args.workers}")
     logger.info("")
     logger.info("Required Services (ensure they are running):")
-    logger.info(f"  Lead Finder:        {os.environ.get('LEAD_FINDER_SERVICE_URL', config.DEFAULT_LEAD_FINDER_URL)}")
-    logger.info(f"  SDR Agent:          {os.environ.get('SDR_SERVICE_URL', config.DEFAULT_SDR_URL)}")
-    logger.info(f"  Lead Manager:       {os.environ.get('LEAD_MANAGER_SERVICE_URL', config.DEFAULT_LEAD_MANAGER_URL)}")
+    logger.info(f"  Lead Finder:        {config.lead_finder_url()}")
+    logger.info(f"  SDR Agent:          {config.sdr_url()}")
+    logger.info(f"  Lead Manager:       {config.lead_manager_url()}")
     logger.info("")
     logger.info("Environment Variables:")
     logger.info(f"  GOOGLE_API_KEY: {'✓ Set' if google_api_key else '✗ Not set'}")
@@ -101,7 +101,10 @@ def main():
         "log_level": args.log_level.lower(),
         "reload": args.reload,
         "workers": args.workers if not args.reload else 1,  # Workers > 1 incompatible with reload
-        "access_log": True,
+        "loop": "uvloop",
+        "http": "httptools",
+        # Per-request access lines are only worth their cost when debugging
+        "access_log": args.log_level.upper() == "DEBUG",
         "use_colors": True,
     }
 
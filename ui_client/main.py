@@ -7,6 +7,7 @@ updates via WebSocket and A2A integration with sales agents.
 """
 
 import asyncio
+import gzip
 import json
 import logging
 import os
@@ -21,10 +22,10 @@ from enum import Enum
 # Common project imports
 import common.config as config
 import httpx
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, Field, ValidationError, field_validator
 
 from fastapi import Depends, FastAPI, Form, Request, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
@@ -122,9 +123,19 @@ class AgentUpdate(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.now)
     data: Optional[dict[str, Any]] = None
 
+class AgentUpdateBatch(BaseModel):
+    agent_type: AgentType
+    updates: List[AgentUpdate]
+
 class LeadFinderRequest(BaseModel):
     city: str = Field(..., min_length=1, max_length=100, description="Target city for lead finding")
 
+    @field_validator("city", mode="before")
+    @classmethod
+    def normalize_city(cls, value: Any) -> Any:
+        """Collapse surrounding and repeated whitespace so equal cities reach the agents identically."""
+        return " ".join(value.split()) if isinstance(value, str) else value
+
 class HumanInputRequest(BaseModel):
     request_id: str
     prompt: str
@@ -227,9 +238,7 @@ async def call_lead_finder_agent_a2a(city: str, session_id: str) -> dict[str, An
     """
     business_logger = logging.getLogger(BUSINESS_LOGIC_LOGGER)
     
-    lead_finder_url = os.environ.get(
-        "LEAD_FINDER_SERVICE_URL", config.DEFAULT_LEAD_FINDER_URL
-    ).rstrip("/")
+    lead_finder_url = config.lead_finder_url()
     
     business_logger.info(f"Calling Lead Finder at {lead_finder_url} for city: {city}")
     
@@ -344,9 +353,7 @@ async def call_lead_finder_agent_simple(city: str, session_id: str) -> dict[str,
     """
     business_logger = logging.getLogger(BUSINESS_LOGIC_LOGGER)
     
-    lead_finder_url = os.environ.get(
-        "LEAD_FINDER_SERVICE_URL", config.DEFAULT_LEAD_FINDER_URL
-    ).rstrip("/")
+    lead_finder_url = config.lead_finder_url()
     
     business_logger.info(f"Calling Lead Finder (simple HTTP) at {lead_finder_url} for city: {city}")
     
@@ -377,6 +384,12 @@ async def call_lead_finder_agent_simple(city: str, session_id: str) -> dict[str,
                     response = await client.post(endpoint, json=search_data)
                     
                     if response.status_code == 200:
+                        # Lead Finder's /find_leads streams one business per line
+                        if response.headers.get("content-type", "").startswith("application/x-ndjson"):
+                            outcome["success"] = True
+                            outcome["businesses"] = [json.loads(line) for line in response.text.splitlines() if line]
+                            break
+
                         result_data = response.json()
                         business_logger.info(f"Got response from {endpoint}: {result_data}")
                         
@@ -429,9 +442,7 @@ async def call_sdr_agent_a2a(business_data: dict[str, Any], session_id: str) ->
     """
     business_logger = logging.getLogger(BUSINESS_LOGIC_LOGGER)
     
-    sdr_url = os.environ.get(
-        "SDR_SERVICE_URL", config.DEFAULT_SDR_URL
-    ).rstrip("/")
+    sdr_url = config.sdr_url()
     
     business_logger.info(f"Calling SDR agent at {sdr_url} for business: {business_data.get('name', 'Unknown')}")
     
@@ -511,9 +522,7 @@ async def call_sdr_agent_simple(business_data: dict[str, Any], session_id: str)
     """
     business_logger = logging.getLogger(BUSINESS_LOGIC_LOGGER)
     
-    sdr_url = os.environ.get(
-        "SDR_SERVICE_URL", config.DEFAULT_SDR_URL
-    ).rstrip("/")
+    sdr_url = config.sdr_url()
     
     business_logger.info(f"Calling SDR agent (simple HTTP) at {sdr_url} for business: {business_data.get('name', 'Unknown')}")
     
@@ -580,9 +589,7 @@ async def call_lead_manager_agent_a2a(query: str, session_id: str) -> dict[str,
     """
     business_logger = logging.getLogger(BUSINESS_LOGIC_LOGGER)
     
-    lead_manager_url = os.environ.get(
-        "LEAD_MANAGER_SERVICE_URL", config.DEFAULT_LEAD_MANAGER_URL
-    ).rstrip("/")
+    lead_manager_url = config.lead_manager_url()
     
     business_logger.info(f"Calling Lead Manager at {lead_manager_url} for query: {query}")
     
@@ -680,9 +687,7 @@ async def call_lead_manager_agent_simple(query: str, session_id: str) -> dict[st
     """
     business_logger = logging.getLogger(BUSINESS_LOGIC_LOGGER)
     
-    lead_manager_url = os.environ.get(
-        "LEAD_MANAGER_SERVICE_URL", config.DEFAULT_LEAD_MANAGER_URL
-    ).rstrip("/")
+    lead_manager_url = config.lead_manager_url()
     
     business_logger.info(f"Calling Lead Manager (simple) at {lead_manager_url} for query: {query}")
     
@@ -935,6 +940,40 @@ async def agent_callback(update: AgentUpdate):
     return JSONResponse(status_code=200, content={"status": "success", "message": "Business processed"})
 
 
+@app.post("/agent_callbacks_bulk")
+async def agent_callbacks_bulk(request: Request):
+    """
+    Endpoint for agents to send many business updates in a single request.
+    Each update goes through the same handling as /agent_callback.
+    Accepts gzip-compressed JSON bodies (Content-Encoding: gzip).
+    """
+    body = await request.body()
+    try:
+        if request.headers.get("content-encoding", "").lower() == "gzip":
+            body = gzip.decompress(body)
+        batch = AgentUpdateBatch.model_validate_json(body)
+    except (OSError, EOFError, ValidationError) as e:
+        logger.warning(f"Invalid bulk agent callback body: {e}")
+        return JSONResponse(status_code=422, content={"status": "error", "message": f"Invalid request body: {e}"})
+
+    logger.info(f"Received bulk agent callback: {batch.agent_type} with {len(batch.updates)} updates")
+
+    processed = 0
+    for update in batch.updates:
+        response = await agent_callback(update)
+        if response.status_code == 200:
+            processed += 1
+
+    return JSONResponse(
+        status_code=200,
+        content={
+            "status": "success",
+            "message": f"Processed {processed} of {len(batch.updates)} updates",
+            "processed": processed,
+        },
+    )
+
+
 @app.get("/", response_class=HTMLResponse)
 async def read_root(request: Request) -> HTMLResponse:
     """Serves the main page - either input form or dashboard."""
@@ -981,7 +1020,7 @@ async def start_lead_finding(city: str = Form(...)):
     
     try:
         # Validate input
-        request_data = LeadFinderRequest(city=city.strip())
+        request_data = LeadFinderRequest(city=city)
         
         app_state["is_running"] = True
         app_state["current_city"] = request_data.city
@@ -1018,13 +1057,14 @@ async def start_lead_finding(city: str = Form(...)):
         )
 
 
-@app.get("/api/businesses")
+@app.get("/api/businesses", response_class=ORJSONResponse, response_model=None)
 async def get_businesses():
     """API endpoint to get all businesses."""
-    return {
-        "businesses": [business.dict() for business in app_state["businesses"].values()],
+    # Pass-through payload: skip response validation and encode with orjson
+    return ORJSONResponse({
+        "businesses": [business.model_dump() for business in app_state["businesses"].values()],
         "total": len(app_state["businesses"])
-    }
+    })
 
 @app.get("/api/status")
 async def get_status():
@@ -1238,7 +1278,7 @@ async def submit_human_input_response(request_id: str, response: HumanInputRespo
     
     # Try to notify the human creation tool via HTTP callback to SDR agent
     success = False
-    agent_url = os.environ.get("SDR_SERVICE_URL", config.DEFAULT_SDR_URL).rstrip("/")
+    agent_url = config.sdr_url()
     callback_url = f"{agent_url}/api/human-input/{request_id}"
     try:
         async with httpx.AsyncClient(timeout=10.0) as client:
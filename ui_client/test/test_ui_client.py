@@ -13,6 +13,7 @@ Run tests with:
     pytest tests/test_ui_client.py::test_health_check -v
 """
 
+import gzip
 import json
 import pytest
 import asyncio
@@ -99,7 +100,17 @@ class TestUIClient:
             assert app_state["is_running"] is True
             assert app_state["session_id"] is not None
             mock_process.assert_called_once()
-    
+
+    def test_start_lead_finding_normalizes_city(self, client, reset_app_state):
+        """Test that surrounding and repeated whitespace is collapsed in the city."""
+        with patch("ui_client.main.run_lead_finding_process"):
+            response = client.post(
+                "/start_lead_finding", data={"city": "  New   York "}, follow_redirects=False
+            )
+            assert response.status_code == 303
+            assert response.headers["location"] == "/"
+            assert app_state["current_city"] == "New York"
+
     def test_start_lead_finding_empty_city(self, client, reset_app_state):
         """Test starting lead finding with empty city input."""
         response = client.post("/start_lead_finding", data={"city": ""})
@@ -162,7 +173,59 @@ class TestUIClient:
         data = response.json()
         assert data["status"] == "error"
         assert "not found" in data["message"]
-    
+
+    def test_agent_callbacks_bulk_creates_businesses(self, client, reset_app_state):
+        """Test bulk agent callback creates one business per update."""
+        batch_data = {
+            "agent_type": "lead_finder",
+            "updates": [
+                {
+                    "agent_type": "lead_finder",
+                    "business_id": f"biz-{i}",
+                    "status": "found",
+                    "message": f"Successfully discovered business: Business {i}",
+                    "data": {"name": f"Business {i}", "city": "Chicago"}
+                }
+                for i in range(3)
+            ]
+        }
+
+        with patch.object(manager, "send_update") as mock_send:
+            response = client.post("/agent_callbacks_bulk", json=batch_data)
+            assert response.status_code == 200
+            data = response.json()
+            assert data["status"] == "success"
+            assert data["processed"] == 3
+
+            assert set(app_state["businesses"]) == {"biz-0", "biz-1", "biz-2"}
+            assert mock_send.call_count == 3
+
+    def test_agent_callbacks_bulk_gzip_body(self, client, reset_app_state):
+        """Test bulk agent callback accepts gzip-compressed bodies."""
+        batch_data = {
+            "agent_type": "lead_finder",
+            "updates": [
+                {
+                    "agent_type": "lead_finder",
+                    "business_id": "biz-gzip",
+                    "status": "found",
+                    "message": "Successfully discovered business: Gzip Cafe",
+                    "data": {"name": "Gzip Cafe", "city": "Chicago"}
+                }
+            ]
+        }
+        body = gzip.compress(json.dumps(batch_data).encode())
+
+        with patch.object(manager, "send_update"):
+            response = client.post(
+                "/agent_callbacks_bulk",
+                content=body,
+                headers={"Content-Type": "application/json", "Content-Encoding": "gzip"}
+            )
+            assert response.status_code == 200
+            assert response.json()["processed"] == 1
+            assert app_state["businesses"]["biz-gzip"].name == "Gzip Cafe"
+
     def test_api_businesses_empty(self, client, reset_app_state):
         """Test businesses API endpoint with no businesses."""
         response = client.get("/api/businesses")